@@ -4,6 +4,7 @@ Code relating to the reading in of data sources.
 """
 
 from datachef.cardinal.directions import down, left, right, up
+from datachef.readers import predicates
 from datachef.readers.acquire import acquire
 from datachef.selection import filters
 from datachef.utils.preview.previewer import label, preview
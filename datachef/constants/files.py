@@ -10,3 +10,10 @@ class SupportedLocalFiles:
 
 
 SUPPORTED_LOCAL_FILETYPES = SupportedLocalFiles()
+
+# The number of bytes read from a local csv at a time
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# The number of bytes of a local csv parsed by a worker process at a
+# time, where the csv is read in parallel
+CSV_CHUNK_SIZE = 1024 * 1024
@@ -1,11 +1,16 @@
 from .badparams import (
     BadExcelReferenceError,
     BadShiftParameterError,
+    IncompatibleReadOptionsError,
     ReversedExcelRefError,
     UnknownDirectionError,
     UnsupportedLocalFileError,
 )
-from .cells import InvlaidCellPositionError, NonExistentCellComparissonError
+from .cells import (
+    FrozenCellPositionError,
+    InvlaidCellPositionError,
+    NonExistentCellComparissonError,
+)
 from .common import (
     CellsDoNotExistError,
     FileInputError,
@@ -13,8 +18,10 @@ from .common import (
     InvalidTableSignatures,
     LoneValueOnMultipleCellsError,
     OutOfBoundsError,
+    ReadOnlyTableError,
     UnalignedTableOperation,
     UnnamedTableError,
+    UnorderedCellsError,
 )
 from .construction import ComponentConstructionError, DimensionConstructionError
 from .lookups import FailedLookupError, MissingDirectLookupError
@@ -80,3 +80,18 @@ class UnknownDirectionError(Exception):
         **kwargs,
     ):
         super().__init__(msg, *args, **kwargs)
+
+
+class IncompatibleReadOptionsError(Exception):
+    """
+    User has passed options to a reader that cannot be used together,
+    eg: a region to read from a memory mapped csv.
+    """
+
+    def __init__(
+        self,
+        msg=("The provided read options cannot be used together."),
+        *args,
+        **kwargs,
+    ):
+        super().__init__(msg, *args, **kwargs)
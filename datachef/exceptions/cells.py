@@ -32,3 +32,20 @@ class InvlaidCellPositionError(Exception):
         **kwargs,
     ):
         super().__init__(msg, *args, **kwargs)
+
+
+class FrozenCellPositionError(Exception):
+    """
+    Raised where a user attempts to change the x or y position of a cell
+    once it has been set.
+
+    Cells are hashed by position so their position cannot change.
+    """
+
+    def __init__(
+        self,
+        msg=("The position of a cell cannot be changed once it has been set."),
+        *args,
+        **kwargs,
+    ):
+        super().__init__(msg, *args, **kwargs)
@@ -124,3 +124,39 @@ class OutOfBoundsError(Exception):
         **kwargs,
     ):
         super().__init__(msg, *args, **kwargs)
+
+
+class UnorderedCellsError(Exception):
+    """
+    Raised where cells are added to a table that requires them in
+    row major order (see SparseTable) out of that order.
+    """
+
+    def __init__(
+        self,
+        msg=(
+            "Cells must be added to this table in row order, each row "
+            "left to right without gaps."
+        ),
+        *args,
+        **kwargs,
+    ):
+        super().__init__(msg, *args, **kwargs)
+
+
+class ReadOnlyTableError(Exception):
+    """
+    Raised where cells are added to a table that is read directly
+    from its source (see MappedTable) so cannot hold further cells.
+    """
+
+    def __init__(
+        self,
+        msg=(
+            "Cells cannot be added to a table read directly from a memory "
+            "mapped file."
+        ),
+        *args,
+        **kwargs,
+    ):
+        super().__init__(msg, *args, **kwargs)
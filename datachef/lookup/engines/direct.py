@@ -7,7 +7,6 @@ from datachef.exceptions import (
     UnknownDirectionError,
 )
 from datachef.models.source.cell import Cell
-from datachef.selection import datafuncs as dfc
 from datachef.selection.selectable import Selectable
 
 from ..base import BaseLookupEngine
@@ -42,7 +41,6 @@ class Directly(BaseLookupEngine):
         would be the dimensional values.
         """
         self.direction: Direction = direction
-        cells = selection.cells
 
         # Given we know the relationship is always
         # along a single axis, we'll create a
@@ -74,9 +72,9 @@ class Directly(BaseLookupEngine):
                 f"The direction parameter must be of type: {type(Direction)}"
             )
         if self.direction.name in ["left", "up"]:
-            ordered_cells = dfc.order_cells_leftright_topbottom(cells)
+            ordered_cells = selection.ordered_cells()
         elif self.direction.name in ["right", "down"]:
-            ordered_cells = dfc.order_cells_rightleft_bottomtop(cells)
+            ordered_cells = selection.ordered_cells(reverse=True)
         else:
             # Shouldn't happend unless someone is hacking in something
             raise UnknownDirectionError(f"The direction {direction.name} is unknown.")
@@ -3,28 +3,113 @@ Classes representing a sinlge cell of data.
 """
 from __future__ import annotations
 
+import math
+import operator
+import re
 from dataclasses import dataclass
 from os import linesep
-from typing import Optional
+from typing import Any, Optional
 
 from datachef.exceptions import (
+    FrozenCellPositionError,
     InvalidCellObjectError,
     InvlaidCellPositionError,
     NonExistentCellComparissonError,
 )
 from datachef.utils import cellutils
+from datachef.utils.decorators import slotted
 
 from .cellformat import CellFormatting
 
 
-@dataclass
+def value_is_blank(value: Optional[str], disregard_whitespace: bool = True) -> bool:
+    """
+    Can the value of a cell be regarded as blank
+    """
+    if isinstance(value, str):
+        v = value.strip() if disregard_whitespace else value
+        if v == "":
+            return True
+        else:
+            return False
+
+    if not value:
+        return True
+
+    raise InvalidCellObjectError(
+        f'A cell should have a str or nan/None value, got "{value}"'
+    )
+
+
+# A plain signed decimal number, eg: "12", "-0.5" or ".5"
+_NUMBER = re.compile(r"\s*[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)\s*")
+
+
+def value_as_number(value: Any) -> float:
+    """
+    The value of a cell as a number, or NaN where the value
+    cannot be regarded as a (finite) number.
+
+    A str value is regarded as a number where it is a plain signed
+    decimal, ignoring surrounding whitespace. So "12", "-0.5" and
+    " 3.25 " are numbers but "1e3", "1_000", "inf" and "1,000" are not.
+    """
+    if isinstance(value, str):
+        return float(value) if _NUMBER.fullmatch(value) else math.nan
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) if math.isfinite(value) else math.nan
+    return math.nan
+
+
+def _frozen_position(name: str) -> property:
+    """
+    A read only property for the x or y position of a cell, held
+    in the slot of the same name with a leading underscore.
+    """
+
+    def refuse(cell: BaseCell, value: Any):
+        raise FrozenCellPositionError(
+            f"Cannot change the {name} position of a cell once it is set."
+        )
+
+    # The getter is kept to C, as positions are read in hot loops
+    return property(
+        operator.attrgetter(f"_{name}"),
+        refuse,
+        doc=f"The {name} position of the cell.",
+    )
+
+
+@slotted
+@dataclass(init=False, repr=False)
 class BaseCell:
     """
     A primitive non value holding cell construct.
+
+    Cells are hashed by position, so can be held in sets and
+    used as dictionary keys. As such the position of a cell
+    cannot be changed once set, it is held in private slots
+    behind the read only x and y properties.
     """
 
-    x: Optional[int] = None
-    y: Optional[int] = None
+    _x: Optional[int] = None
+    _y: Optional[int] = None
+
+    def __init__(self, x: Optional[int] = None, y: Optional[int] = None):
+        self._x = x
+        self._y = y
+
+    x = _frozen_position("x")
+    y = _frozen_position("y")
+
+    def __repr__(self):
+        return f"BaseCell(x={self._x}, y={self._y})"
+
+    def __hash__(self) -> int:
+        """
+        Hash the cell by its x and y position
+        """
+        return hash((self.x, self.y))
 
     def _confirm_not_virtual(self):
         """
@@ -101,7 +186,8 @@ class BaseCell:
         return "VIRTUAL CELL"
 
 
-@dataclass
+@slotted
+@dataclass(init=False, repr=False)
 class VirtualCell(BaseCell):
     """
     Where we are establishing relationships between a concrete cell
@@ -113,8 +199,18 @@ class VirtualCell(BaseCell):
     """
 
     value: Optional[str] = None
-    x: Optional[str] = None
-    y: Optional[str] = None
+
+    def __init__(
+        self,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        value: Optional[str] = None,
+    ):
+        self._x = x
+        self._y = y
+        self.value = value
+
+    __hash__ = BaseCell.__hash__
 
     def __repr__(self):
         """
@@ -124,37 +220,43 @@ class VirtualCell(BaseCell):
         return f'<{self._excel_ref()}, value:"{self.value}">'
 
 
-@dataclass
+@slotted
+@dataclass(init=False, repr=False)
 class Cell(BaseCell):
     """
     Denotes a cell of data from a tabulated data source
     """
 
     value: Optional[str] = None
-    x: Optional[str] = None
-    y: Optional[str] = None
 
     # Optional as some tabullated formats (eg csv) do not have
     # cell formatting.
     cellformat: Optional[CellFormatting] = None
 
+    def __init__(
+        self,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        value: Optional[str] = None,
+        cellformat: Optional[CellFormatting] = None,
+    ):
+        self._x = x
+        self._y = y
+        self.value = value
+        self.cellformat = cellformat
+
+    __hash__ = BaseCell.__hash__
+
     def is_blank(self, disregard_whitespace: bool = True):
         """
         Can the contents of the cell be regarded as blank
         """
-        if isinstance(self.value, str):
-            v = self.value.strip() if disregard_whitespace else self.value
-            if v == "":
-                return True
-            else:
-                return False
-
-        if not self.value:
-            return True
-
-        raise InvalidCellObjectError(
-            f"Error with {self._as_xy_str()} A cell should have a str or nan/None value"
-        )
+        try:
+            return value_is_blank(self.value, disregard_whitespace)
+        except InvalidCellObjectError:
+            raise InvalidCellObjectError(
+                f"Error with {self._as_xy_str()} A cell should have a str or nan/None value"
+            )
 
     def is_not_blank(self, disregard_whitespace: bool = True):
         """
@@ -0,0 +1,234 @@
+"""
+Classes and functions for the lazy evaluation and memoisation of selections.
+
+A lazy selection (see LiveTable.lazy) does not run the selection methods
+called on it, it records them as a chain of pending operations. The chain
+is run, as a whole, the first time the selection is needed, at which point
+it can be planned rather than run call by call.
+
+Separately, every selection records a canonical description of the chain of
+calls that derived it from its source table (its "expression"). Where the
+same chain is made again from the same source table the result is taken
+from the memo rather than being worked out again.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    A selection method that has been called but not yet run.
+
+    :param restricts: the method only ever narrows a selection down, by
+    a criteria that does not depend on the rest of the selection. Such
+    operations can be run in any order relative to one another.
+    """
+
+    method: Callable
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    restricts: bool = False
+
+    def apply(self, selection):
+        """
+        Run the operation against the provided selection, returning
+        the resulting selection.
+        """
+        return self.method(selection, *self.args, **self.kwargs)
+
+    @property
+    def is_cell_check(self) -> bool:
+        """
+        Is this a filter using a check that has to be called once
+        per cell, i.e it cannot filter a whole table at once.
+        """
+        return (
+            self.method.__name__ == "filter"
+            and len(self.args) == 1
+            and not callable(getattr(self.args[0], "mask", None))
+        )
+
+
+@dataclass
+class AllOf:
+    """
+    A check that combines many checks into one, that is met where
+    a cell meets every one of them.
+    """
+
+    checks: List[Callable]
+
+    def __call__(self, cell) -> bool:
+        return all(check(cell) for check in self.checks)
+
+
+def plan(operations: List[Operation]) -> List[Operation]:
+    """
+    Given a chain of operations, return an equivalent chain that is
+    cheaper to run.
+
+    Within each run of consecutive restricting operations, those that
+    work on the whole table at once (masks) are moved ahead of checks
+    made cell by cell, so the latter see as few cells as possible. The
+    cell by cell checks are then fused into a single filter, so the
+    remaining cells are passed over once.
+    """
+    planned: List[Operation] = []
+    run: List[Operation] = []
+
+    for operation in operations:
+        if operation.restricts:
+            run.append(operation)
+            continue
+        planned += _plan_restrictions(run)
+        planned.append(operation)
+        run = []
+
+    planned += _plan_restrictions(run)
+    return planned
+
+
+def _plan_restrictions(run: List[Operation]) -> List[Operation]:
+    """
+    Order and fuse a run of restricting operations.
+    """
+    planned = [operation for operation in run if not operation.is_cell_check]
+    cell_checks = [operation for operation in run if operation.is_cell_check]
+
+    if len(cell_checks) == 1:
+        planned += cell_checks
+    elif len(cell_checks) > 1:
+        checks = [operation.args[0] for operation in cell_checks]
+        planned.append(
+            Operation(cell_checks[0].method, (AllOf(checks),), restricts=True)
+        )
+    return planned
+
+
+class UndescribableError(Exception):
+    """
+    Raised where a canonical description cannot be given for an
+    argument of a selection method, eg: a lambda.
+    """
+
+
+def describe(value: Any) -> Hashable:
+    """
+    Return a canonical and hashable description of an argument
+    passed to a selection method, where two arguments with equal
+    descriptions will always make the same selection.
+
+    Raises UndescribableError where no such description can be given,
+    this includes any callable that is not a dataclass (eg: a lambda), as
+    what it does can depend upon state that changes between calls.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return (type(value).__name__, value)
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(describe(v) for v in value))
+
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted((describe(v) for v in value), key=repr)))
+
+    # A selection, described by its chain of calls from the source table
+    if hasattr(value, "_expression"):
+        if value._expression is None:
+            raise UndescribableError(f"Cannot describe selection {value}")
+        return (
+            "selection",
+            value.signature,
+            value.pristine._version,
+            value._expression,
+        )
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__qualname__,
+            tuple(
+                (f.name, describe(getattr(value, f.name)))
+                for f in dataclasses.fields(value)
+            ),
+        )
+
+    raise UndescribableError(f"Cannot describe {value}")
+
+
+def describe_call(
+    expression: Optional[tuple], name: str, args: tuple, kwargs: dict
+) -> Optional[tuple]:
+    """
+    Given the expression of a selection, return the expression of
+    the selection made by calling the named method upon it. None
+    where either expression cannot be described.
+    """
+    if expression is None:
+        return None
+    try:
+        call = (
+            name,
+            describe(args),
+            tuple((k, describe(v)) for k, v in sorted(kwargs.items())),
+        )
+    except UndescribableError:
+        return None
+    return expression + (call,)
+
+
+class SelectionMemo:
+    """
+    A memo of the selections made from a source table, keyed by the
+    signature and the expression of the selection. Each table holds its own memo, so the
+    memo goes with the table, and starts afresh whenever the values of
+    the table change. The pristine table is kept alongside the selection
+    mask, as some selection methods (spread) change it.
+
+    A memo holds at most max_size selections, discarding the least
+    recently used first. Memos can be turned off by setting enabled
+    to False, eg: SelectionMemo.enabled = False
+    """
+
+    enabled = True
+    max_size = 128
+
+    def __init__(self):
+        self._selections: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, int]]:
+        """
+        Return the pristine table and mask memoised for the key, if any.
+        """
+        if not self.enabled:
+            return None
+        selection = self._selections.get(key)
+        if selection is not None:
+            self._selections.move_to_end(key)
+        return selection
+
+    def put(self, key: Hashable, pristine: Any, mask: int):
+        """
+        Memoise the pristine table and mask of a selection, pristine
+        being None where it is the table holding the memo (so a table
+        and its memo do not refer to one another).
+        """
+        if not self.enabled:
+            return
+        self._selections[key] = (pristine, mask)
+        self._selections.move_to_end(key)
+        while len(self._selections) > self.max_size:
+            self._selections.popitem(last=False)
+
+    def clear(self):
+        """
+        Discard every memoised selection.
+        """
+        self._selections.clear()
+
+    def __len__(self) -> int:
+        return len(self._selections)
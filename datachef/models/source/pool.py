@@ -0,0 +1,82 @@
+"""
+Class representing a pool of the distinct values held by a table.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class ValuePool:
+    """
+    A pool of the distinct values held by the cells of a table.
+
+    Tabulated sources repeat the same values (dimension labels,
+    units etc) many times over. Passing each value through the pool
+    means every occurrence of a string value references one shared
+    object, and that every distinct value has a small integer code,
+    so equality checks between values can be made between codes.
+
+    Values are only ever added to a pool, so a code once given
+    remains valid.
+    """
+
+    def __init__(self):
+        self._codes: Dict[Any, int] = {}
+        self._values: List[Any] = []
+
+    def intern(self, value: Any) -> Any:
+        """
+        Add the value to the pool where not already present. Returns
+        the pooled equivalent of a str value, any other value is
+        returned as is.
+        """
+        code = self.code(value)
+        if type(value) is str:
+            return self._values[code]
+        return value
+
+    def intern_all(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Intern each of the provided values, as intern() does but
+        without a call per value, for use when adding rows of cells.
+        """
+        codes = self._codes
+        pooled = self._values
+        interned = []
+        for value in values:
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(pooled)
+                pooled.append(value)
+            interned.append(pooled[code] if type(value) is str else value)
+        return interned
+
+    def code(self, value: Any) -> int:
+        """
+        Return the code for the value, adding the value to
+        the pool where not already present.
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return code
+
+    def code_of(self, value: Any) -> Optional[int]:
+        """
+        Return the code for the value, or None where the
+        value is not in the pool.
+        """
+        return self._codes.get(value)
+
+    def value(self, code: int) -> Any:
+        """
+        Return the value for the given code
+        """
+        return self._values[code]
+
+    def __len__(self) -> int:
+        """
+        The number of distinct values in the pool
+        """
+        return len(self._values)
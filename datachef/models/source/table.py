@@ -4,34 +4,1200 @@ Classes representing a single cell of data.
 
 from __future__ import annotations
 
+import bisect
 import copy
+import itertools
+import math
+import mmap
+import os
 import uuid
+from array import array
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from datachef.exceptions import (
+    CellsDoNotExistError,
     InvalidTableSignatures,
+    ReadOnlyTableError,
     UnalignedTableOperation,
     UnnamedTableError,
+    UnorderedCellsError,
 )
-from datachef.models.source.cell import BaseCell, Cell
-from datachef.selection import datafuncs as dfc
-from datachef.utils.decorators import dontmutate
+from datachef.models.source import expression
+from datachef.models.source.cell import BaseCell, Cell, value_as_number, value_is_blank
+from datachef.models.source.expression import Operation
+from datachef.models.source.pool import ValuePool
+from datachef.utils import fileutils, maskutils, regexutils
+from datachef.utils.decorators import deferrable, dontmutate
+
+
+def _is_blank(value: Any, disregard_whitespace: bool) -> bool:
+    """
+    As value_is_blank, but regarding a value that is neither a str
+    nor a nan/None value as not blank rather than raising.
+    """
+    if value and not isinstance(value, str):
+        return False
+    return value_is_blank(value, disregard_whitespace)
+
+
+# Source of the version of a table, see Table._clear_value_indexes
+_versions = itertools.count()
 
 
 class Table:
     """
-    Represents a table of data in the form of a list of cells.
+    Represents a table of data.
+
+    The table is stored columnar, as parallel compact arrays of x and
+    y co-ordinates alongside a list of values, with the position of a
+    cell being its offset into those arrays. Cell objects are only
+    materialised from the columns (once) when the cells of the table
+    are asked for.
+
+    A table can equally be constructed from a list of cells, in which
+    case the columns are derived from those cells upon first use.
+
+    Values are added to the table via its ValuePool, so repeated
+    values are held once and can be compared by code (see .codes).
     """
 
     def __init__(self, cells: Optional[List[Cell]] = None):
-        self.cells = cells
+        self._xs: Optional[array] = array("i")
+        self._ys: Optional[array] = array("i")
+        self._values: Optional[List[Any]] = []
+        self._codes: Optional[array] = None
+        self._cells: Optional[List[Cell]] = None
+        self._clear_positional_indexes()
+        self._clear_value_indexes()
+        self.pool = ValuePool()
+        self.use_ngram_index = False
+        if cells is not None:
+            self.cells = cells
         self._signature = str(uuid.uuid4())
 
+    @property
+    def cells(self) -> List[Cell]:
+        """
+        Accessor for the cells held by this table, where the table
+        is held as columns the cells are materialised on first access.
+        """
+        if self._cells is None:
+            self._cells = [
+                Cell(x=x, y=y, value=value)
+                for x, y, value in zip(self.xs, self.ys, self.values)
+            ]
+        return self._cells
+
+    @cells.setter
+    def cells(self, cells: List[Cell]):
+        """
+        Setter for the cells property, the columns and any existing
+        coordinate index are discarded as they may no longer be valid.
+        """
+        self._cells = cells
+        self._xs = None
+        self._ys = None
+        self._values = None
+        self._codes = None
+        self._clear_positional_indexes()
+        self._clear_value_indexes()
+
+    def _ensure_columns(self):
+        """
+        Where the table has been populated from a list of cells, derive
+        the columns from those cells.
+        """
+        if self._xs is None:
+            self._xs = array("i", (c.x for c in self._cells))
+            self._ys = array("i", (c.y for c in self._cells))
+            self._values = [self.pool.intern(c.value) for c in self._cells]
+
+    @property
+    def xs(self) -> array:
+        """
+        The x co-ordinate of every cell in the table, by position
+        """
+        self._ensure_columns()
+        return self._xs
+
+    @property
+    def ys(self) -> array:
+        """
+        The y co-ordinate of every cell in the table, by position
+        """
+        self._ensure_columns()
+        return self._ys
+
+    @property
+    def values(self) -> List[Any]:
+        """
+        The value of every cell in the table, by position
+        """
+        self._ensure_columns()
+        return self._values
+
+    @property
+    def codes(self) -> array:
+        """
+        The code (as given by the pool of this table) of the value of
+        every cell in the table, by position. Cells with equal values
+        have equal codes.
+
+        Built once upon first use.
+        """
+        if self._codes is None:
+            self._codes = array("i", (self.pool.code(v) for v in self.values))
+        return self._codes
+
+    def append(self, x: int, y: int, value: Any):
+        """
+        Append a single cell to the table by way of its
+        co-ordinates and value, without creating a cell object.
+        """
+        self._ensure_columns()
+        value = self.pool.intern(value)
+        self._xs.append(x)
+        self._ys.append(y)
+        self._values.append(value)
+        if self._codes is not None:
+            self._codes.append(self.pool.code(value))
+        if self._cells is not None:
+            self._cells.append(Cell(x=x, y=y, value=value))
+        self._clear_positional_indexes()
+        self._clear_value_indexes()
+
+    def append_row(self, y: int, values: List[Any], x: int = 0):
+        """
+        Append a row of cells to the table by way of their values,
+        the first cell being at the given x and y co-ordinates and
+        each following cell one to the right, without creating cell
+        objects. Cheaper than appending the cells one at a time.
+        """
+        self.append_rows([values], y=y, x=x)
+
+    def append_rows(self, rows: Iterable[List[Any]], y: int = 0, x: int = 0):
+        """
+        Append rows of cells to the table by way of their values, the
+        rows being at consecutive y indicies from the given y and the
+        first cell of each row being at the given x. Cheaper than
+        appending the rows one at a time, as indexes are cleared once.
+        """
+        self._ensure_columns()
+        for y, values in enumerate(rows, y):
+            values = self.pool.intern_all(values)
+            self._xs.extend(range(x, x + len(values)))
+            self._ys.extend(itertools.repeat(y, len(values)))
+            self._values.extend(values)
+            if self._codes is not None:
+                self._codes.extend(self.pool.code(value) for value in values)
+            if self._cells is not None:
+                self._cells.extend(
+                    Cell(x=x + i, y=y, value=value) for i, value in enumerate(values)
+                )
+        self._clear_positional_indexes()
+        self._clear_value_indexes()
+
     def add_cell(self, cell: Cell):
-        if not self.cells:
-            self.cells = []
-        self.cells.append(cell)
+        cell.value = self.pool.intern(cell.value)
+        self._ensure_columns()
+        self._xs.append(cell.x)
+        self._ys.append(cell.y)
+        self._values.append(cell.value)
+        if self._codes is not None:
+            self._codes.append(self.pool.code(cell.value))
+        if self._cells is not None:
+            self._cells.append(cell)
+        self._clear_positional_indexes()
+        self._clear_value_indexes()
+
+    def set_value(self, position: int, value: Any):
+        """
+        Set the value of the cell at the given position.
+        """
+        self.set_values({position: value})
+
+    def set_values(self, values: Dict[int, Any]):
+        """
+        Set the values of the cells at the given positions, updating
+        the value column, the codes, any materialised cells and the
+        blank masks. Other indexes of values are discarded.
+        """
+        values = {p: self.pool.intern(v) for p, v in values.items()}
+        self._store_values(values)
+
+        blank_masks = {}
+        for disregard_whitespace, mask in self._blank_masks.items():
+            blank, not_blank = [], []
+            for position, value in values.items():
+                if _is_blank(value, disregard_whitespace):
+                    blank.append(position)
+                else:
+                    not_blank.append(position)
+            blank_masks[disregard_whitespace] = (
+                mask | maskutils.positions_to_mask(blank, len(self))
+            ) & ~maskutils.positions_to_mask(not_blank, len(self))
+
+        self._clear_value_indexes()
+        self._blank_masks = blank_masks
+
+    def _store_values(self, values: Dict[int, Any]):
+        """
+        Store the (pooled) values of the cells at the given positions.
+        """
+        for position, value in values.items():
+            self._store_value(position, value)
+
+    def _store_value(self, position: int, value: Any):
+        """
+        Store the (pooled) value of the cell at the given position.
+        """
+        if self._values is not None:
+            self._values[position] = value
+        if self._codes is not None:
+            self._codes[position] = self.pool.code(value)
+        if self._cells is not None:
+            self._cells[position].value = value
+
+    def __len__(self) -> int:
+        """
+        The number of cells held by the table
+        """
+        if self._xs is None:
+            return len(self._cells)
+        return len(self._xs)
+
+    def _clear_positional_indexes(self):
+        """
+        Discard the indexes of cell positions, to be called
+        whenever cells are added to or replaced in the table.
+        """
+        self._xy_index: Optional[Dict[Tuple[int, int], int]] = None
+        self._row_index: Optional[Dict[int, Tuple[array, array]]] = None
+        self._column_index: Optional[Dict[int, Tuple[array, array]]] = None
+        self._row_major: Optional[bool] = None
+        self._row_order: Optional[Tuple[array, array]] = None
+        self._column_order: Optional[Tuple[array, array]] = None
+
+    # The number of pattern masks a table holds at once, the least
+    # recently used being discarded first.
+    _pattern_mask_limit = 64
+
+    def _clear_value_indexes(self):
+        """
+        Discard anything derived from the values of the table, to be
+        called whenever cells are added or values are changed.
+
+        The table is also given a new version, unique amongst all
+        tables, and the selections memoised against the previous
+        values are discarded (see expression.SelectionMemo).
+        """
+        self._version = next(_versions)
+        self._memo = expression.SelectionMemo()
+        self._pattern_masks: OrderedDict[str, int] = OrderedDict()
+        self._value_index: Optional[Dict[Any, array]] = None
+        self._ngram_index: Optional[Dict[str, Set[str]]] = None
+        self._numbers: Optional[array] = None
+        self._numeric_order: Optional[Tuple[array, array]] = None
+        self._blank_masks: Dict[bool, int] = {}
+        self._invalid_mask: Optional[int] = None
+
+    def blank_mask(self, disregard_whitespace: bool = True) -> int:
+        """
+        Return a mask of the positions of the cells with a blank value,
+        by default a value of just whitespace is considered blank.
+
+        Built once upon first use and kept up to date as values are set.
+        Cells whose value is not a str (see invalid_mask) are left out.
+        """
+        mask = self._blank_masks.get(disregard_whitespace)
+        if mask is None:
+            mask = self.value_mask(
+                v for v in self.distinct_values if _is_blank(v, disregard_whitespace)
+            )
+            self._blank_masks[disregard_whitespace] = mask
+        return mask
+
+    def invalid_mask(self) -> int:
+        """
+        Return a mask of the positions of the cells with a value that
+        can be regarded as neither blank nor not blank, being neither
+        a str nor a nan/None value.
+        """
+        if self._invalid_mask is None:
+            self._invalid_mask = self.value_mask(
+                v for v in self.distinct_values if not isinstance(v, str) and v
+            )
+        return self._invalid_mask
+
+    def check_blankable(self, mask: int):
+        """
+        Raise InvalidCellObjectError, as checking the cells one at a
+        time would, where any cell in the given mask has a value that
+        can be regarded as neither blank nor not blank.
+        """
+        invalid = mask & self.invalid_mask()
+        if invalid:
+            value_is_blank(self.value_at((invalid & -invalid).bit_length() - 1))
+
+    def pattern_mask(self, pattern: str) -> int:
+        """
+        Return a mask of the positions of the cells whose value
+        matches the provided regular expression pattern.
+
+        The pattern is evaluated once per distinct value of the table
+        and the mask is kept, so applying the same pattern again costs
+        a dictionary lookup. Where the pattern requires some literal
+        text, only the values containing that text are evaluated.
+        """
+        mask = self._pattern_masks.get(pattern)
+        if mask is not None:
+            self._pattern_masks.move_to_end(pattern)
+            return mask
+
+        match = regexutils.compile_pattern(pattern).match
+        candidates = self._values_containing(regexutils.required_literal(pattern))
+        mask = self.value_mask(v for v in candidates if match(v))
+
+        self._pattern_masks[pattern] = mask
+        if len(self._pattern_masks) > self._pattern_mask_limit:
+            self._pattern_masks.popitem(last=False)
+        return mask
+
+    @property
+    def value_index(self) -> Dict[Any, array]:
+        """
+        A mapping of each distinct value in the table to the
+        positions (ascending) of the cells holding that value.
+
+        Built once upon first use.
+        """
+        if self._value_index is None:
+            index: Dict[Any, array] = {}
+            for position, value in enumerate(self.values):
+                positions = index.get(value)
+                if positions is None:
+                    positions = index[value] = array("i")
+                positions.append(position)
+            self._value_index = index
+        return self._value_index
+
+    @property
+    def distinct_values(self) -> Iterable[Any]:
+        """
+        The distinct values held by the cells of the table.
+        """
+        return self.value_index.keys()
+
+    def value_mask(self, values: Iterable[Any]) -> int:
+        """
+        Return a mask of the positions of the cells whose value
+        is any one of the provided values.
+        """
+        index = self.value_index
+        return maskutils.positions_to_mask(
+            (p for value in set(values) for p in index.get(value, ())), len(self)
+        )
+
+    def substring_mask(self, substr: str) -> int:
+        """
+        Return a mask of the positions of the cells whose
+        value contains the provided text.
+        """
+        return self.value_mask(
+            v for v in self._values_containing(substr) if substr in v
+        )
+
+    @property
+    def ngram_index(self) -> Dict[str, Set[str]]:
+        """
+        A mapping of each n-gram (run of regexutils.NGRAM_LENGTH
+        characters) found in the values of the table to the distinct
+        values that contain it.
+
+        Built once upon first use.
+        """
+        if self._ngram_index is None:
+            index: Dict[str, Set[str]] = {}
+            for value in self.distinct_values:
+                if isinstance(value, str):
+                    for ngram in regexutils.ngrams(value):
+                        index.setdefault(ngram, set()).add(value)
+            self._ngram_index = index
+        return self._ngram_index
+
+    def _values_containing(self, text: str) -> Iterable[str]:
+        """
+        Return the distinct str values of the table that may contain
+        the provided text, to be confirmed by the caller.
+
+        Where the table uses an n-gram index (see .use_ngram_index)
+        only the values holding every n-gram of the text are returned,
+        otherwise every str value is.
+        """
+        if self.use_ngram_index and len(text) >= regexutils.NGRAM_LENGTH:
+            index = self.ngram_index
+            candidates = [index.get(ngram, set()) for ngram in regexutils.ngrams(text)]
+            return set.intersection(*candidates)
+        return [v for v in self.distinct_values if isinstance(v, str)]
+
+    @property
+    def numbers(self) -> array:
+        """
+        The value of every cell in the table as a float, by position,
+        with NaN for any value that cannot be regarded as a number.
+
+        Built once upon first use, each distinct value being parsed once.
+        """
+        if self._numbers is None:
+            parsed = {value: value_as_number(value) for value in self.distinct_values}
+            self._numbers = array("d", (parsed[value] for value in self.values))
+        return self._numbers
+
+    @property
+    def numeric_order(self) -> Tuple[array, array]:
+        """
+        A tuple of the numbers (ascending) held by the cells that have
+        a numeric value and the positions of those cells.
+
+        Built once upon first use.
+        """
+        if self._numeric_order is None:
+            ordered = sorted(
+                (number, position)
+                for position, number in enumerate(self.numbers)
+                if not math.isnan(number)
+            )
+            self._numeric_order = (
+                array("d", (number for number, _ in ordered)),
+                array("i", (position for _, position in ordered)),
+            )
+        return self._numeric_order
+
+    def numeric_mask(
+        self,
+        minimum: float = -math.inf,
+        maximum: float = math.inf,
+        inclusive: bool = True,
+    ) -> int:
+        """
+        Return a mask of the positions of the cells with a numeric
+        value between the minimum and maximum provided, by default
+        every cell with a numeric value.
+
+        :param inclusive: whether values equal to the minimum or
+        maximum are included.
+        """
+        numbers, positions = self.numeric_order
+        if inclusive:
+            start = bisect.bisect_left(numbers, minimum)
+            end = bisect.bisect_right(numbers, maximum)
+        else:
+            start = bisect.bisect_right(numbers, minimum)
+            end = bisect.bisect_left(numbers, maximum)
+        return maskutils.positions_to_mask(positions[start:end], len(self))
+
+    def integer_mask(self) -> int:
+        """
+        Return a mask of the positions of the cells
+        with a value that is a whole number.
+        """
+        numbers, positions = self.numeric_order
+        return maskutils.positions_to_mask(
+            (p for n, p in zip(numbers, positions) if n.is_integer()), len(self)
+        )
+
+    @property
+    def xy_index(self) -> Dict[Tuple[int, int], int]:
+        """
+        A mapping of (x, y) co-ordinates to the position of the
+        cell in question within this table.
+
+        Built once upon first use.
+        """
+        if self._xy_index is None:
+            self._xy_index = {xy: i for i, xy in enumerate(zip(self.xs, self.ys))}
+        return self._xy_index
+
+    @property
+    def row_index(self) -> Dict[int, Tuple[array, array]]:
+        """
+        A mapping of each y index in use to a tuple of the x indicies
+        (ascending) of the cells on that row and the positions of
+        those cells.
+
+        Built once upon first use.
+        """
+        if self._row_index is None:
+            self._row_index = self._group_positions(self.ys, self.xs)
+        return self._row_index
+
+    @property
+    def column_index(self) -> Dict[int, Tuple[array, array]]:
+        """
+        A mapping of each x index in use to a tuple of the y indicies
+        (ascending) of the cells in that column and the positions of
+        those cells.
+
+        Built once upon first use.
+        """
+        if self._column_index is None:
+            self._column_index = self._group_positions(self.xs, self.ys)
+        return self._column_index
+
+    @property
+    def row_major(self) -> bool:
+        """
+        Are the cells of the table held in row major order, i.e
+        ordered left to right then top to bottom, as the readers
+        add them.
+
+        Worked out once upon first use.
+        """
+        if self._row_major is None:
+            xs, ys = self.xs, self.ys
+            self._row_major = all(
+                (ys[i], xs[i]) < (ys[i + 1], xs[i + 1]) for i in range(len(xs) - 1)
+            )
+        return self._row_major
+
+    def _order(self, by_columns: bool) -> Tuple[array, array]:
+        """
+        A tuple of the positions of the cells of the table ordered by
+        rows (or columns) and the rank of each position in that order.
+
+        Built once upon first use.
+        """
+        order = self._column_order if by_columns else self._row_order
+        if order is None:
+            lines = self.column_index if by_columns else self.row_index
+            ordered = array("i")
+            for line in sorted(lines):
+                ordered.extend(lines[line][1])
+            rank = array("i", bytes(ordered.itemsize * len(ordered)))
+            for i, position in enumerate(ordered):
+                rank[position] = i
+            order = (ordered, rank)
+            if by_columns:
+                self._column_order = order
+            else:
+                self._row_order = order
+        return order
+
+    def ordered_positions(
+        self, positions: Iterable[int], by_columns: bool = False, reverse: bool = False
+    ) -> List[int]:
+        """
+        Given the positions of cells of the table, return them in the
+        order the cells are met reading the table left to right then
+        top to bottom. Or by_columns, top to bottom then left to right.
+
+        Where the table is row major ordering by rows is an ordering
+        by position, which is a single pass for ascending positions
+        (as given by a selection mask).
+        """
+        if by_columns or not self.row_major:
+            _, rank = self._order(by_columns)
+            ordered = sorted(positions, key=rank.__getitem__, reverse=reverse)
+        else:
+            ordered = sorted(positions, reverse=reverse)
+        return ordered
+
+    def ordered_cells(
+        self, by_columns: bool = False, reverse: bool = False
+    ) -> List[Cell]:
+        """
+        Return the cells of the table in the order given by
+        ordered_positions().
+        """
+        cells = self.cells
+        return [
+            cells[p]
+            for p in self.ordered_positions(range(len(cells)), by_columns, reverse)
+        ]
+
+    def positions_within(
+        self, min_x: int, max_x: int, min_y: int, max_y: int
+    ) -> List[int]:
+        """
+        Return the positions of the cells within the rectangle bounded
+        (inclusively) by the provided x and y indicies, using the row
+        index so only the cells in range are visited.
+        """
+        row_index = self.row_index
+        if max_y - min_y < len(row_index):
+            rows = (row_index.get(y) for y in range(min_y, max_y + 1))
+        else:
+            rows = (row_index[y] for y in sorted(row_index) if min_y <= y <= max_y)
+
+        positions: List[int] = []
+        for row in rows:
+            if row is not None:
+                xs, row_positions = row
+                positions += row_positions[
+                    bisect.bisect_left(xs, min_x) : bisect.bisect_right(xs, max_x)
+                ]
+        return positions
+
+    @staticmethod
+    def _group_positions(keys: array, offsets: array) -> Dict[int, Tuple[array, array]]:
+        """
+        Group the positions of cells by key, each group being
+        ordered by offset.
+        """
+        groups: Dict[int, List[Tuple[int, int]]] = {}
+        for position, (key, offset) in enumerate(zip(keys, offsets)):
+            groups.setdefault(key, []).append((offset, position))
+
+        grouped = {}
+        for key, group in groups.items():
+            group.sort()
+            grouped[key] = (
+                array("i", (offset for offset, _ in group)),
+                array("i", (position for _, position in group)),
+            )
+        return grouped
+
+    def position_of(self, x: int, y: int) -> Optional[int]:
+        """
+        Return the position of the cell at the specified x and y
+        co-ordinates, or None where no such cell exists in this table.
+        """
+        return self.xy_index.get((x, y))
+
+    def positions_of(self, cells: List[BaseCell]) -> List[int]:
+        """
+        Return the positions of the provided cells within this table.
+        """
+        return [self.position_of(c.x, c.y) for c in cells]
+
+    def value_at(self, position: int) -> Any:
+        """
+        Return the value of the cell at the given position.
+        """
+        return self.values[position]
+
+    def cells_at(self, positions: Iterable[int]) -> List[Cell]:
+        """
+        Return the cells at the given positions.
+
+        The cells returned are the callers own, copies of any cells
+        the table holds, so changing them does not change the table.
+        Where the cells of the table are not yet materialised, only the
+        cells asked for are created (from the columns).
+        """
+        if self._cells is not None:
+            cells = self._cells
+            return [copy.copy(cells[p]) for p in positions]
+        xs, ys = self.xs, self.ys
+        return [Cell(x=xs[p], y=ys[p], value=self.value_at(p)) for p in positions]
+
+    def cell_at(self, x: int, y: int) -> Optional[Cell]:
+        """
+        Return the cell at the specified x and y co-ordinates, or
+        None where no such cell exists in this table.
+        """
+        i = self.position_of(x, y)
+        return None if i is None else self.cells_at([i])[0]
+
+    # Attributes a copy of a table shares with the original rather than
+    # copying. Only positional information that a table never mutates
+    # in place (it is replaced when invalidated) belongs here. The value
+    # pool is shared too, as values are only ever added to it.
+    _shared_on_copy = (
+        "_signature",
+        "_xy_index",
+        "_row_index",
+        "_column_index",
+        "_row_major",
+        "_row_order",
+        "_column_order",
+        "pool",
+    )
+
+    def __deepcopy__(self, memo: dict) -> Table:
+        """
+        Copies the table column by column. The columns, and any index
+        that is changed in place, are copied shallowly as the (pooled)
+        values they hold are never changed in place. The coordinate
+        index is shared, the positions it records are equally valid
+        for the copy and it is never mutated in place.
+
+        Materialised cells are not copied, the copy materialises its
+        own from the columns should they be asked for.
+        """
+        if self._xs is None and self._cells is not None:
+            self._ensure_columns()
+
+        table = type(self).__new__(type(self))
+        memo[id(self)] = table
+        for name, value in self.__dict__.items():
+            if name in self._shared_on_copy:
+                table.__dict__[name] = value
+            elif name == "_memo":
+                table.__dict__[name] = expression.SelectionMemo()
+            elif name == "_cells":
+                table.__dict__[name] = None
+            elif isinstance(value, (list, dict, array)):
+                table.__dict__[name] = copy.copy(value)
+            else:
+                table.__dict__[name] = value
+        return table
+
+
+class SparseTable(Table):
+    """
+    A table that only stores the cells that hold a value.
+
+    Tabulated sources are often mostly empty cells, so rather than store
+    every cell a sparse table records the extent of each row and stores
+    the positions (ascending, in a compact array) and values of the non
+    empty cells only. Empty cells are answered implicitly, with a value
+    of "", and the indexes of values are built from the stored cells, so
+    no value is held for the empty cells at any point.
+
+    Positions are assigned exactly as they would be for a Table populated
+    in the same order, so a sparse table behaves identically to a table,
+    only the storage differs.
+
+    Note: only cells with an empty value are not stored, cells holding
+    whitespace are kept so is_blank(disregard_whitespace=False) still
+    gives the correct answer.
+
+    Cells must be appended in row major order (as the readers do).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._xs = None
+        self._ys = None
+        self._values = None
+        self._row_offsets = array("q")
+        self._row_starts = array("i")
+        self._row_widths = array("i")
+        self._stored_positions = array("i")
+        self._stored_values: List[Any] = []
+        self._size = 0
+
+    def append(self, x: int, y: int, value: Any):
+        """
+        Append a single cell to the table by way of its
+        co-ordinates and value.
+        """
+        self.append_row(y, [value], x=x)
+
+    def append_rows(self, rows: Iterable[List[Any]], y: int = 0, x: int = 0):
+        """
+        Append rows of cells to the table by way of their values, the
+        rows being at consecutive y indicies from the given y and the
+        first cell of each row being at the given x.
+        """
+        for y, values in enumerate(rows, y):
+            if y < len(self._row_widths) - 1:
+                raise UnorderedCellsError(
+                    f"Cells must be added in row order, got row {y} after "
+                    f"row {len(self._row_widths) - 1}."
+                )
+            while len(self._row_widths) <= y:
+                self._row_offsets.append(self._size)
+                self._row_starts.append(x)
+                self._row_widths.append(0)
+            if x != self._row_starts[y] + self._row_widths[y]:
+                raise UnorderedCellsError(
+                    f"Cells must be added left to right without gaps, got x {x} "
+                    f"for row {y} where x {self._row_starts[y] + self._row_widths[y]} "
+                    "comes next."
+                )
+
+            for position, value in enumerate(self.pool.intern_all(values), self._size):
+                if value != "":
+                    self._stored_positions.append(position)
+                    self._stored_values.append(value)
+            self._row_widths[y] += len(values)
+            self._size += len(values)
+
+        self._cells = None
+        self._xs = None
+        self._ys = None
+        self._values = None
+        self._codes = None
+        self._clear_positional_indexes()
+        self._clear_value_indexes()
+
+    def add_cell(self, cell: Cell):
+        self.append(cell.x, cell.y, cell.value)
+
+    @property
+    def cells(self) -> List[Cell]:
+        """
+        Accessor for the cells of this table, cells are materialised
+        (including those not stored) on first access.
+
+        Read only, a sparse table cannot be populated from a list of cells.
+        """
+        return super().cells
+
+    def _ensure_columns(self):
+        """
+        Derive the co-ordinate columns, including the cells not
+        stored, from the extent of each row.
+        """
+        if self._xs is None:
+            self._xs = array("i")
+            self._ys = array("i")
+            for y, (start, width) in enumerate(zip(self._row_starts, self._row_widths)):
+                self._xs.extend(range(start, start + width))
+                self._ys.extend([y] * width)
+
+    @property
+    def values(self) -> List[Any]:
+        """
+        The value of every cell in the table, by position.
+
+        Built afresh on each access, a sparse table never holds a value
+        for every cell, see _stored_items for the values it does hold.
+        """
+        values: List[Any] = [""] * self._size
+        for position, value in self._stored_items():
+            values[position] = value
+        return values
+
+    def _stored_items(self) -> Iterable[Tuple[int, Any]]:
+        """
+        The position and value of every cell with a value other
+        than "", by ascending position.
+        """
+        return zip(self._stored_positions, self._stored_values)
+
+    def _clear_value_indexes(self):
+        super()._clear_value_indexes()
+        self._empty_mask: Optional[int] = None
+
+    @property
+    def value_index(self) -> Dict[Any, array]:
+        """
+        A mapping of each distinct value in the table to the positions
+        (ascending) of the cells holding that value, built from the
+        stored cells so the cells with a value of "" are not included
+        (see value_mask).
+
+        Built once upon first use.
+        """
+        if self._value_index is None:
+            index: Dict[Any, array] = {}
+            for position, value in self._stored_items():
+                positions = index.get(value)
+                if positions is None:
+                    positions = index[value] = array("i")
+                positions.append(position)
+            self._value_index = index
+        return self._value_index
+
+    @property
+    def distinct_values(self) -> Iterable[Any]:
+        """
+        The distinct values held by the cells of the table.
+        """
+        values = list(self.value_index)
+        if self.empty_mask():
+            values.append("")
+        return values
+
+    def empty_mask(self) -> int:
+        """
+        Return a mask of the positions of the cells with a value of "",
+        being every cell that is not stored.
+
+        Built once upon first use.
+        """
+        if self._empty_mask is None:
+            stored = maskutils.positions_to_mask(
+                (p for p, _ in self._stored_items()), self._size
+            )
+            self._empty_mask = maskutils.full_mask(self._size) & ~stored
+        return self._empty_mask
+
+    def value_mask(self, values: Iterable[Any]) -> int:
+        """
+        Return a mask of the positions of the cells whose value
+        is any one of the provided values.
+        """
+        values = set(values)
+        mask = super().value_mask(values - {""})
+        if "" in values:
+            mask |= self.empty_mask()
+        return mask
+
+    @property
+    def numbers(self) -> array:
+        """
+        The value of every cell in the table as a float, by position,
+        with NaN for any value that cannot be regarded as a number.
+
+        Built once upon first use, from the stored cells.
+        """
+        if self._numbers is None:
+            numbers = array("d", [math.nan]) * self._size
+            parsed: Dict[Any, float] = {}
+            for position, value in self._stored_items():
+                number = parsed.get(value)
+                if number is None:
+                    number = parsed[value] = value_as_number(value)
+                numbers[position] = number
+            self._numbers = numbers
+        return self._numbers
+
+    def __len__(self) -> int:
+        """
+        The number of cells in the table, stored or otherwise
+        """
+        return self._size
+
+    def position_of(self, x: int, y: int) -> Optional[int]:
+        """
+        Return the position of the cell at the specified x and y
+        co-ordinates, or None where no such cell exists in this table.
+        """
+        if 0 <= y < len(self._row_widths):
+            start = self._row_starts[y]
+            if start <= x < start + self._row_widths[y]:
+                return self._row_offsets[y] + x - start
+        return None
+
+    def value_at(self, position: int) -> Any:
+        """
+        Return the value of the cell at the given position.
+        """
+        positions = self._stored_positions
+        i = bisect.bisect_left(positions, position)
+        if i < len(positions) and positions[i] == position:
+            return self._stored_values[i]
+        return ""
+
+    @property
+    def row_major(self) -> bool:
+        """
+        The cells of a sparse table are always held in row major order.
+        """
+        return True
+
+    @property
+    def row_index(self) -> Dict[int, Tuple[array, array]]:
+        """
+        A mapping of each y index in use to a tuple of the x indicies
+        (ascending) of the cells on that row and the positions of
+        those cells, worked out from the extent of each row.
+
+        Built once upon first use.
+        """
+        if self._row_index is None:
+            self._row_index = {
+                y: (
+                    array("i", range(start, start + width)),
+                    array("i", range(offset, offset + width)),
+                )
+                for y, (start, width, offset) in enumerate(
+                    zip(self._row_starts, self._row_widths, self._row_offsets)
+                )
+                if width
+            }
+        return self._row_index
+
+    @property
+    def column_index(self) -> Dict[int, Tuple[array, array]]:
+        """
+        A mapping of each x index in use to a tuple of the y indicies
+        (ascending) of the cells in that column and the positions of
+        those cells, worked out from the extent of each row.
+
+        Built once upon first use.
+        """
+        if self._column_index is None:
+            index: Dict[int, Tuple[array, array]] = {}
+            for y, (start, width, offset) in enumerate(
+                zip(self._row_starts, self._row_widths, self._row_offsets)
+            ):
+                for x in range(start, start + width):
+                    column = index.get(x)
+                    if column is None:
+                        column = index[x] = (array("i"), array("i"))
+                    column[0].append(y)
+                    column[1].append(offset + x - start)
+            self._column_index = index
+        return self._column_index
+
+    def positions_within(
+        self, min_x: int, max_x: int, min_y: int, max_y: int
+    ) -> List[int]:
+        """
+        Return the positions of the cells within the rectangle bounded
+        (inclusively) by the provided x and y indicies, worked out from
+        the extent of each row in range.
+        """
+        positions: List[int] = []
+        for y in range(max(min_y, 0), min(max_y + 1, len(self._row_widths))):
+            start, offset = self._row_starts[y], self._row_offsets[y]
+            first = max(min_x, start)
+            last = min(max_x + 1, start + self._row_widths[y])
+            positions += range(offset + first - start, offset + last - start)
+        return positions
+
+    def _store_values(self, values: Dict[int, Any]):
+        """
+        Store the (pooled) values of the cells at the given positions,
+        merging them into the stored cells in a single pass.
+        """
+        old_positions, old_values = self._stored_positions, self._stored_values
+        positions, stored = array("i"), []
+        i = 0
+        for position, value in sorted(values.items()):
+            j = bisect.bisect_left(old_positions, position, i)
+            positions.extend(old_positions[i:j])
+            stored.extend(old_values[i:j])
+            i = j + (j < len(old_positions) and old_positions[j] == position)
+            if value != "":
+                positions.append(position)
+                stored.append(value)
+        positions.extend(old_positions[i:])
+        stored.extend(old_values[i:])
+        self._stored_positions, self._stored_values = positions, stored
+
+        for position, value in values.items():
+            Table._store_value(self, position, value)
+
+
+class MappedTable(SparseTable):
+    """
+    A table of the rows of a csv file that is memory mapped rather
+    than read.
+
+    Upon construction only an index of the byte offset of each row
+    (and the number of fields on it) is built, a row is decoded when
+    the value of one of its cells is first asked for. So selections
+    that work by position alone (excel_ref, expand etc) and selections
+    of a handful of rows touch only the parts of the file they need.
+
+    Positions are assigned exactly as they would be for a table read
+    from the same csv, so a mapped table behaves identically to one.
+
+    Values set on the table are held apart from the file, which is
+    never written to. Cells cannot be appended to a mapped table.
+    """
+
+    def __init__(self, path: Union[Path, str], delimiter: str = ","):
+        super().__init__()
+        self._delimiter = delimiter
+        with open(path, "rb") as csv_file:
+            if os.fstat(csv_file.fileno()).st_size > 0:
+                self._map = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._map = b""
+        self._row_bounds, self._row_widths = fileutils.csv_row_index(
+            self._map, delimiter
+        )
+        self._row_offsets = array(
+            "q", itertools.accumulate(self._row_widths, initial=0)
+        )
+        self._size = self._row_offsets.pop()
+        self._row_starts = array("i", [0]) * len(self._row_widths)
+        self._rows: Dict[int, List[Any]] = {}
+        self._overrides: Dict[int, Any] = {}
+
+    def _raw_row(self, y: int) -> bytes:
+        """
+        The bytes of the row at the given y index.
+        """
+        return self._map[self._row_bounds[y] : self._row_bounds[y + 1]]
+
+    def _row(self, y: int) -> List[Any]:
+        """
+        The (pooled) values of the row at the given y index,
+        decoded from the file on first use.
+        """
+        row = self._rows.get(y)
+        if row is None:
+            row = self.pool.intern_all(
+                fileutils.decode_csv_row(self._raw_row(y), self._delimiter)
+            )
+            self._rows[y] = row
+        return row
+
+    def value_at(self, position: int) -> Any:
+        """
+        Return the value of the cell at the given position.
+        """
+        if position in self._overrides:
+            return self._overrides[position]
+        y = bisect.bisect_right(self._row_offsets, position) - 1
+        return self._row(y)[position - self._row_offsets[y]]
+
+    def cells_at(self, positions: Iterable[int]) -> List[Cell]:
+        """
+        Return the cells at the given positions, see Table.cells_at,
+        working out the co-ordinates of each from the row extents.
+        """
+        if self._cells is not None:
+            return super().cells_at(positions)
+
+        cells = []
+        for position in positions:
+            y = bisect.bisect_right(self._row_offsets, position) - 1
+            cells.append(
+                Cell(
+                    x=position - self._row_offsets[y],
+                    y=y,
+                    value=self.value_at(position),
+                )
+            )
+        return cells
+
+    @property
+    def cells(self) -> List[Cell]:
+        """
+        Accessor for the cells of this table, cells are materialised
+        on first access.
+        """
+        if self._cells is None:
+            self._cells = self.cells_at(range(self._size))
+        return self._cells
+
+    def append_rows(self, rows: Iterable[List[Any]], y: int = 0, x: int = 0):
+        """
+        Cells cannot be added to a mapped table, the rows
+        of the table being those of the file.
+        """
+        raise ReadOnlyTableError()
+
+    def _stored_items(self) -> Iterable[Tuple[int, Any]]:
+        """
+        The position and value of every cell with a value other
+        than "", by ascending position, decoding every row.
+        """
+        overrides = self._overrides
+        for y, offset in enumerate(self._row_offsets):
+            for position, value in enumerate(self._row(y), offset):
+                if position in overrides:
+                    value = overrides[position]
+                if value != "":
+                    yield position, value
+
+    def _store_values(self, values: Dict[int, Any]):
+        """
+        Store the (pooled) values of the cells at the given positions,
+        apart from the file.
+        """
+        self._overrides.update(values)
+        for position, value in values.items():
+            Table._store_value(self, position, value)
+
+    # The file mapping and what is decoded from it are never
+    # changed in place, so are shared with copies of the table.
+    _shared_on_copy = SparseTable._shared_on_copy + (
+        "_map",
+        "_row_bounds",
+        "_rows",
+    )
 
 
 class LiveTable:
@@ -45,20 +1211,82 @@ class LiveTable:
     extend a Table of cells (.filtered) via comparing it with the pristine Table
     (.pristine). This enables the extension of a cell selection as well as the
     filtering down of one.
+
+    The current selection is held as a mask (an int used as a bitset) over the
+    positions of the cells in the pristine table, so combining selections taken
+    from the same table is a bitwise operation.
     """
 
     def __init__(
         self, pristine: Table, filtered: Table, _name: str = None, source: str = None
     ):
         self.pristine: Table = pristine
-        self.filtered: Table = filtered
         self._name: Optional[str] = _name
         self.source: Union[Path, str] = source
 
         # An optional label used when working with previews
         self._label: Optional[str] = None
 
-        self.validate()
+        # Whether selection methods are run as called or deferred
+        self._lazy: bool = False
+
+        self.validate(filtered)
+        self.mask = self._mask_from_table(filtered)
+
+        # The chain of calls that derived this selection from the whole
+        # of the source table, unknown unless we start with all of it.
+        if self._mask == maskutils.full_mask(len(self.pristine)):
+            self._expression = ()
+
+    def _mask_from_table(self, filtered: Table) -> int:
+        """
+        Get the selection mask representing the cells of a table
+        taken from the pristine table.
+
+        Passing the pristine table itself as the filtered table is
+        the cheap way of constructing a livetable with every cell
+        selected.
+        """
+        if filtered is self.pristine:
+            return maskutils.full_mask(len(self.pristine))
+        return self._mask_from_positions(
+            [self.pristine.position_of(*xy) for xy in zip(filtered.xs, filtered.ys)]
+        )
+
+    def _mask_from_positions(self, positions: List[Optional[int]]) -> int:
+        """
+        Get the selection mask representing the provided positions within
+        the pristine table, a position of None (a cell that is not in the
+        pristine table) cannot be selected.
+        """
+        if None in positions:
+            raise CellsDoNotExistError(
+                "Only cells of the pristine table can be selected, "
+                f"{positions.count(None)} of the cells provided are not in it."
+            )
+        return maskutils.positions_to_mask(positions, len(self.pristine))
+
+    def __copy__(self) -> LiveTable:
+        """
+        Create a copy of this livetable sharing the pristine table.
+
+        The pristine table is never modified in place by a selection,
+        where one must change it (see spread) it first takes its own
+        copy via _copy_pristine_on_write(). So the only state a copy
+        needs of its own is the selection mask.
+        """
+        livetable = type(self).__new__(type(self))
+        livetable.__dict__.update(self.__dict__)
+        livetable._selected_cells = None
+        return livetable
+
+    def _copy_pristine_on_write(self):
+        """
+        Replace the shared pristine table with a private copy of
+        it, to be called before modifying the pristine table.
+        """
+        self.pristine = copy.deepcopy(self.pristine)
+        self._selected_cells = None
 
     @property
     def name(self):
@@ -70,20 +1298,161 @@ class LiveTable:
         else:
             raise UnnamedTableError()
 
+    @property
+    def mask(self) -> int:
+        """
+        Accessor for the mask representing the current selection,
+        running any pending operations of a lazy selection first.
+        """
+        if self._pending:
+            self._evaluate()
+        return self._mask
+
+    @mask.setter
+    def mask(self, mask: int):
+        """
+        Setter for the mask representing the current selection
+        """
+        self._mask = mask
+        self._pending: Tuple[Operation, ...] = ()
+        self._expression: Optional[tuple] = None
+        self._selected_cells: Optional[List[Cell]] = None
+
+    @dontmutate
+    def lazy(self, use: bool = True) -> LiveTable:
+        """
+        Return this selection in (or back out of) lazy mode.
+
+        Selection methods called on a lazy selection are not run
+        as they are called, they are recorded and then run together
+        when the selected cells are first needed. This allows a
+        chain of calls to be planned as a whole (see expression.plan).
+        """
+        self._lazy = use
+        return self
+
+    def _call(self, method: Callable, args: tuple, kwargs: dict) -> LiveTable:
+        """
+        Return the selection made by calling the provided method on this
+        selection, from the memo where the same selection has been made
+        from the same source table before.
+        """
+        called = expression.describe_call(
+            self._expression, method.__name__, args, kwargs
+        )
+        memoised = self._recall(called)
+
+        if memoised is not None:
+            livetable = copy.copy(self)
+            livetable.pristine, livetable.mask = memoised
+        else:
+            livetable = method(self, *args, **kwargs)
+            self._memoise(called, livetable.pristine, livetable.mask)
+
+        livetable._expression = called
+        return livetable
+
+    def _recall(self, called: Optional[tuple]) -> Optional[Tuple[Table, int]]:
+        """
+        Return the pristine table and mask memoised by the pristine
+        table of this selection for the provided expression, if any.
+        """
+        if called is None:
+            return None
+        memoised = self.pristine._memo.get((self.signature, called))
+        if memoised is None:
+            return None
+        pristine, mask = memoised
+        return (self.pristine if pristine is None else pristine), mask
+
+    def _memoise(self, called: Optional[tuple], pristine: Table, mask: int):
+        """
+        Memoise the pristine table and mask of the selection made from
+        the pristine table of this selection by the provided expression.
+        """
+        if called is not None:
+            self.pristine._memo.put(
+                (self.signature, called),
+                None if pristine is self.pristine else pristine,
+                mask,
+            )
+
+    def _defer(
+        self, method: Callable, args: tuple, kwargs: dict, restricts: bool
+    ) -> LiveTable:
+        """
+        Return a copy of this selection with the call to the
+        provided method added to its pending operations.
+        """
+        livetable = copy.copy(self)
+        livetable._pending = self._pending + (
+            Operation(method, args, kwargs, restricts),
+        )
+        livetable._expression = expression.describe_call(
+            self._expression, method.__name__, args, kwargs
+        )
+        return livetable
+
+    def _evaluate(self):
+        """
+        Plan and run the pending operations of this selection,
+        keeping the result as the current selection.
+        """
+        called = self._expression
+        memoised = self._recall(called)
+
+        if memoised is not None:
+            pristine, mask = memoised
+        else:
+            selection = copy.copy(self)
+            selection._pending = ()
+            for operation in expression.plan(list(self._pending)):
+                selection = operation.apply(selection)
+            pristine, mask = selection.pristine, selection.mask
+            self._memoise(called, pristine, mask)
+
+        self.pristine = pristine
+        self.mask = mask
+        self._expression = called
+
+    @property
+    def positions(self) -> List[int]:
+        """
+        The positions within the pristine table of the
+        currently selected cells, in ascending order
+        """
+        return maskutils.mask_to_positions(self.mask)
+
     @property
     def cells(self) -> List[Cell]:
         """
         Accessor for currently selected cells from the
-        currently selected table
+        currently selected table.
+
+        Each selection holds cell objects of its own, so changing
+        them changes neither the pristine table nor other selections,
+        use spread or Table.set_values to change values.
         """
-        return self.filtered.cells
+        if self._selected_cells is None:
+            self._selected_cells = self.pristine.cells_at(self.positions)
+        return self._selected_cells
 
     @cells.setter
     def cells(self, cells: List[Cell]):
         """
-        Setter for the cells property
+        Setter for the cells property, the cells must be
+        cells of the pristine table.
+        """
+        self.mask = self._mask_from_positions(self.pristine.positions_of(cells))
+
+    @property
+    def filtered(self) -> Table:
+        """
+        The currently selected cells as a table
         """
-        self.filtered.cells = cells
+        table = Table(self.cells)
+        table._signature = self.pristine._signature
+        return table
 
     @property
     def pcells(self) -> List[BaseCell]:
@@ -93,11 +1462,35 @@ class LiveTable:
         """
         return self.pristine.cells
 
+    def ordered_cells(
+        self, by_columns: bool = False, reverse: bool = False
+    ) -> List[Cell]:
+        """
+        The currently selected cells in the order they are met reading
+        the table left to right then top to bottom. Or by_columns, top
+        to bottom then left to right.
+
+        :param reverse: return the cells in the reverse of that order.
+        """
+        positions = self.positions
+        cells = dict(zip(positions, self.cells))
+        return [
+            cells[p]
+            for p in self.pristine.ordered_positions(positions, by_columns, reverse)
+        ]
+
+    def pcell_at(self, x: int, y: int) -> Optional[Cell]:
+        """
+        Return the pristine cell at the specified x and y
+        co-ordinates, or None where no such cell exists.
+        """
+        return self.pristine.cell_at(x, y)
+
     def selections_made(self) -> bool:
         """
         Have any selections been made
         """
-        return len(self.pristine.cells) != len(self.filtered.cells)
+        return len(self.pristine) != maskutils.count_positions(self.mask)
 
     @name.setter
     def name(self, name: str):
@@ -110,11 +1503,11 @@ class LiveTable:
         """
         return self.name
 
-    def validate(self):
+    def validate(self, filtered: Table):
         """
         Confirm class is validly constructed.
         """
-        if self.pristine._signature != self.filtered._signature:
+        if self.pristine._signature != filtered._signature:
             raise InvalidTableSignatures()
 
     @staticmethod
@@ -123,21 +1516,39 @@ class LiveTable:
     ) -> LiveTable:
         """
         Given a table and optional it's name, create a livetable.
+
+        The table serves as both the pristine table and the initial
+        (everything selected) filtered table, it is not copied.
         """
         return LiveTable(
             table,
-            copy.deepcopy(table),
+            table,
             _name=name,
             source=source,
         )
 
+    def index_ngrams(self, use: bool = True) -> LiveTable:
+        """
+        Opt in (or back out) of indexing the values of the source
+        table by n-gram. Substring filters and regular expressions
+        requiring some literal text then only consider the values
+        that could contain that text.
+
+        Worthwhile for tables with a lot of distinct free text that
+        are searched repeatedly, at the cost of the memory the index
+        takes. Applies to every selection made from the source table.
+        """
+        self.pristine.use_ngram_index = use
+        return self
+
     @property
     def signature(self):
         """
         A uuid that uniquely identifies a parsed input source table
         """
-        return self.filtered._signature
+        return self.pristine._signature
 
+    @deferrable(restricts=True)
     @dontmutate
     def __sub__(self, other_input: LiveTable):
         """
@@ -151,9 +1562,10 @@ class LiveTable:
         if self.signature != other_input.signature:
             raise UnalignedTableOperation()
 
-        self.cells = dfc.cells_not_in(self.cells, other_input.cells)
+        self.mask = self.mask & ~other_input.mask
         return self
 
+    @deferrable()
     @dontmutate
     def __or__(self, other_input: LiveTable):
         """
@@ -166,8 +1578,23 @@ class LiveTable:
         if self.signature != other_input.signature:
             raise UnalignedTableOperation()
 
-        new_cells = dfc.cells_not_in(other_input.cells, self.cells)
-        self.cells = self.cells + new_cells
+        self.mask = self.mask | other_input.mask
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def __and__(self, other_input: LiveTable):
+        """
+        Implements "&" operator, intersection.
+
+        Allows the intersection of one selection from the same distinct
+        and currently selected table with another. Provided they
+        are derrived from the same initial BaseInput.
+        """
+        if self.signature != other_input.signature:
+            raise UnalignedTableOperation()
+
+        self.mask = self.mask & other_input.mask
         return self
 
     def __iter__(self):
@@ -15,15 +15,21 @@ def acquire(
     source: Any,
     override_reader: Optional[BaseReader] = None,
     override_selectable: Selectable = None,
+    **kwargs,
 ) -> Selectable:
     """
     Principle method for getting new data sources into datachef.
+
+    Any further keyword arguments are passed to the reader, eg:
+    region="A1:M2000" to acquire only the cells of that region, or
+    skip_rows=[is_blank_row] to skip rows as they are read (see
+    readers.predicates).
     """
 
     # TODO: check if source it a python object and call
     # the appropriate handler
     if isinstance(source, list):
-        return ListReader(source).parse()
+        return ListReader(source).parse(**kwargs)
 
     # If it's not a python type, then it's either a
     # local or remote source file
@@ -32,5 +38,8 @@ def acquire(
     # then write read_remote
 
     return read_local(
-        source, override_reader=override_reader, override_selectable=override_selectable
+        source,
+        override_reader=override_reader,
+        override_selectable=override_selectable,
+        **kwargs,
     )
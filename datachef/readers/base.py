@@ -4,12 +4,15 @@ Holds the definition of the reader baseclass: BaseReader
 The BaseReader is to provide functionality that is standard to all readers.
 """
 
+import itertools
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, List, Optional
 
 from datachef.exceptions import FileInputError
+from datachef.models.source.table import Table
+from datachef.selection import datafuncs as dfc
 from datachef.selection.selectable import Selectable
 
 
@@ -28,6 +31,42 @@ class BaseReader(metaclass=ABCMeta):
         if not isinstance(self.source, Path):
             raise FileInputError("The source needs to be pathlib.Path object")
 
+    @staticmethod
+    def _append_rows(
+        table: Table,
+        rows: Iterable[List[Any]],
+        region: Optional[str] = None,
+        skip_rows: Optional[Iterable[Callable[[List[Any]], bool]]] = None,
+    ):
+        """
+        Append the rows read from the source to the table.
+
+        Where a region is given (an excel reference to cells, columns or
+        rows, eg: "A1:M2000", "A:M" or "1:2000") only the cells within it
+        are appended, at their co-ordinates in the source. Fields outside
+        of the region are discarded before any cell is added and no row
+        after the last row of the region is read.
+
+        Where row predicates are given (see readers.predicates) a row for
+        which any of them hold, given the whole of the row as read, is
+        skipped before any cell is added. A skipped row still takes up its
+        y index, so the cells that follow keep their co-ordinates.
+        """
+        min_x, max_x, min_y, max_y = (
+            (0, None, 0, None) if region is None else dfc.excel_region_to_bounds(region)
+        )
+
+        if min_y > 0 or max_y is not None:
+            rows = itertools.islice(rows, min_y, None if max_y is None else max_y + 1)
+        if skip_rows:
+            skip_rows = list(skip_rows)
+            rows = ([] if any(s(row) for s in skip_rows) else row for row in rows)
+        if min_x > 0 or max_x is not None:
+            stop_x = None if max_x is None else max_x + 1
+            rows = (row[min_x:stop_x] for row in rows)
+
+        table.append_rows(rows, y=min_y, x=min_x)
+
     @abstractmethod
     def parse(self) -> Selectable:
         """Parse the datasource into a selectable thing"""
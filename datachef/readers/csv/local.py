@@ -2,14 +2,59 @@
 Holds and defines the local csv reader class.
 """
 
-import copy
 import csv
+import io
+import itertools
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional
 
-from datachef.models.source.cell import Cell
-from datachef.models.source.table import Table
+from datachef.constants.files import CSV_BUFFER_SIZE, CSV_CHUNK_SIZE
+from datachef.exceptions import IncompatibleReadOptionsError
+from datachef.models.source.table import MappedTable, SparseTable, Table
 from datachef.readers.base import BaseReader
 from datachef.selection.csv.csv import CsvInputSelectable
 from datachef.selection.selectable import Selectable
+from datachef.utils import fileutils
+
+# A line added to the end of a chunk, that is read as a row of its own
+# only where the chunk ends at the end of a row
+_CHUNK_END = "\uffff"
+
+
+def _parse_chunk(
+    source: Path, start: int, end: int, delimiter: str
+) -> Optional[List[List[str]]]:
+    """
+    Parse the rows of the csv held between the given byte offsets of
+    the file, as a csv.reader reading the file in text mode would.
+
+    Returns None where the chunk does not end at the end of a row (the
+    chunk offsets being found by quote parity, see csv_chunk_offsets).
+    This is known from a line added to the end of the chunk not being
+    read as a row of its own.
+
+    Equal values are returned as the same object, so they are
+    only pickled once on their way back from a worker process.
+    """
+    with open(source, "rb") as csv_file:
+        csv_file.seek(start)
+        chunk = io.TextIOWrapper(io.BytesIO(csv_file.read(end - start)), "utf8")
+        ends_file = end >= os.fstat(csv_file.fileno()).st_size
+
+    lines = chunk if ends_file else itertools.chain(chunk, [_CHUNK_END + "\n"])
+    pooled = {}
+    rows = [
+        [pooled.setdefault(value, value) for value in row]
+        for row in csv.reader(lines, delimiter=delimiter)
+    ]
+    if not ends_file:
+        if rows.pop() != [_CHUNK_END]:
+            return None
+    return rows
 
 
 class LocalCsvReader(BaseReader):
@@ -19,16 +64,137 @@ class LocalCsvReader(BaseReader):
     """
 
     def parse(
-        self, delimiter=",", selectable: Selectable = CsvInputSelectable
+        self,
+        delimiter=",",
+        selectable: Selectable = CsvInputSelectable,
+        sparse: bool = False,
+        buffer_size: int = CSV_BUFFER_SIZE,
+        mapped: bool = False,
+        workers: int = 1,
+        region: Optional[str] = None,
+        skip_rows: Optional[Iterable[Callable[[List[str]], bool]]] = None,
     ) -> Selectable:
+        """
+        Parse the csv into a selectable.
+
+        The file is streamed, read in chunks of buffer_size bytes,
+        with each row being appended straight into the columns of
+        the table, so no cell objects are created while reading.
+
+        :param delimiter: The delimiter used by the csv.
+        :param selectable: The class of selectable to return.
+        :param sparse: Where True, only cells holding a value are
+        stored, see SparseTable.
+        :param buffer_size: The number of bytes read from the
+        file at a time.
+        :param mapped: Where True, the file is memory mapped rather
+        than read and rows are only decoded once needed, see MappedTable.
+        :param workers: Where more than 1, the file is split into chunks
+        (at row boundaries) of roughly CSV_CHUNK_SIZE bytes that are parsed
+        in parallel by a pool of that many processes, with at most two
+        chunks per process in flight at a time, eg: workers=os.cpu_count().
+        :param region: An excel reference to the cells, columns or rows
+        to read, eg: "A1:M2000", "A:M" or "1:2000". Cells outside of the
+        region are not kept and reading stops after its last row, though
+        where read in parallel the chunks already being parsed are parsed
+        in full. Cannot be used where mapped, as only the rows selected
+        from a mapped table are decoded anyway.
+        :param skip_rows: Row predicates (see readers.predicates), rows
+        for which any hold are skipped as the file is read, eg:
+        skip_rows=[is_blank_row]. Cannot be used where mapped, as the
+        rows of a mapped table are those of the file.
+        """
         self._raise_if_source_is_not_path()
 
-        table = Table()
-        with open(self.source, "r", encoding="utf8") as csv_file:
-            filecontent = csv.reader(csv_file, delimiter=delimiter)
+        if mapped and region is not None:
+            raise IncompatibleReadOptionsError(
+                "A region cannot be read from a memory mapped csv, select "
+                "the region from the table instead, eg: .excel_ref(region)"
+            )
+
+        if mapped and skip_rows is not None:
+            raise IncompatibleReadOptionsError(
+                "Rows cannot be skipped when reading a memory mapped csv."
+            )
+
+        if mapped:
+            table = MappedTable(self.source, delimiter=delimiter)
+            return selectable(table, table, source=self.source)
+
+        table = SparseTable() if sparse else Table()
+        if workers > 1:
+            self._append_rows(
+                table,
+                self._parse_in_parallel(delimiter, workers),
+                region,
+                skip_rows,
+            )
+        else:
+            with open(
+                self.source, "r", encoding="utf8", buffering=buffer_size
+            ) as csv_file:
+                self._append_rows(
+                    table,
+                    csv.reader(csv_file, delimiter=delimiter),
+                    region,
+                    skip_rows,
+                )
+
+        return selectable(table, table, source=self.source)
+
+    def _parse_in_parallel(
+        self, delimiter: str, workers: int, chunk_size: int = CSV_CHUNK_SIZE
+    ) -> Iterator[List[str]]:
+        """
+        Parse the rows of the csv in chunks of roughly chunk_size bytes,
+        in a pool of processes, yielding the rows of every chunk in the
+        order of the file.
+
+        At most two chunks per worker are submitted to the pool at a
+        time, the next being submitted as the rows of each are yielded,
+        so only the rows of those chunks are held at once.
+
+        Where a chunk turns out not to end at the end of a row, the
+        rest of the file (from the start of that chunk) is parsed
+        here instead, so the rows are always those read serially.
+        """
+        with open(self.source, "rb") as csv_file:
+            size = os.fstat(csv_file.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                offsets = fileutils.csv_chunk_offsets(
+                    data, max(workers, size // chunk_size)
+                )
 
-            for y_index, row in enumerate(filecontent):
-                for x_index, cell_value in enumerate(row):
-                    table.add_cell(Cell(x=x_index, y=y_index, value=cell_value))
+        resume_from = None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Chunks are only submitted as they are taken from here
+            submitted = (
+                (
+                    start,
+                    executor.submit(_parse_chunk, self.source, start, end, delimiter),
+                )
+                for start, end in zip(offsets, offsets[1:])
+            )
+            chunks = deque(itertools.islice(submitted, 2 * workers))
+            try:
+                # Each chunk is let go of once its rows are yielded
+                while chunks:
+                    start, chunk = chunks.popleft()
+                    chunks.extend(itertools.islice(submitted, 1))
+                    rows = chunk.result()
+                    if rows is None:
+                        resume_from = start
+                        break
+                    yield from rows
+            finally:
+                for _, chunk in chunks:
+                    chunk.cancel()
 
-        return selectable(table, copy.deepcopy(table), source=self.source)
+        if resume_from is not None:
+            with open(self.source, "rb") as csv_file:
+                csv_file.seek(resume_from)
+                yield from csv.reader(
+                    io.TextIOWrapper(csv_file, "utf8"), delimiter=delimiter
+                )
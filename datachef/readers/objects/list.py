@@ -1,9 +1,9 @@
 """
 Holds and defines the reader for create a selection from a list of lists
 """
-import copy
 
-from datachef.models.source.cell import Cell
+from typing import Any, Callable, Iterable, List, Optional
+
 from datachef.models.source.table import Table
 from datachef.readers.base import BaseReader
 from datachef.selection.selectable import Selectable
@@ -20,11 +20,23 @@ class ListReader(BaseReader):
     ]
     """
 
-    def parse(self, selectable: Selectable = Selectable) -> Selectable:
+    def parse(
+        self,
+        selectable: Selectable = Selectable,
+        region: Optional[str] = None,
+        skip_rows: Optional[Iterable[Callable[[List[Any]], bool]]] = None,
+    ) -> Selectable:
+        """
+        Parse the list of lists into a selectable.
+
+        :param selectable: The class of selectable to return.
+        :param region: An excel reference to the cells, columns or rows
+        to take from the list, eg: "A1:M2000", "A:M" or "1:2000".
+        :param skip_rows: Row predicates (see readers.predicates), rows
+        for which any hold are skipped, eg: skip_rows=[is_blank_row].
+        """
         table = Table()
 
-        for y_index, row in enumerate(self.source):
-            for x_index, cell_value in enumerate(row):
-                table.add_cell(Cell(x=x_index, y=y_index, value=cell_value))
+        self._append_rows(table, self.source, region, skip_rows)
 
-        return selectable(table, copy.deepcopy(table))
+        return selectable(table, table)
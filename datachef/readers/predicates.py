@@ -0,0 +1,60 @@
+"""
+Row predicates, for skipping whole rows of a source as it is read.
+
+A row predicate is a callable that is given a row as read from the
+source (a list of the values of its fields) and returns True where
+the row should be skipped, eg:
+
+acquire(path, skip_rows=[is_blank_row, first_cell_matches("^Note")])
+
+As with filters, the predicates that are classes are exported under
+snake case names.
+"""
+
+from dataclasses import dataclass
+from typing import Any, List
+
+from datachef.models.source.cell import value_is_blank
+from datachef.utils import regexutils
+
+
+@dataclass
+class IsBlankRow:
+    """
+    A row predicate that holds for rows where every field is blank,
+    including rows with no fields at all. A field holding a value
+    that is neither a str nor None is not blank.
+    """
+
+    disregard_whitespace: bool = True
+
+    def __call__(self, row: List[Any]) -> bool:
+        return all(
+            (v is None or isinstance(v, str))
+            and value_is_blank(v, self.disregard_whitespace)
+            for v in row
+        )
+
+
+@dataclass
+class FirstCellMatches:
+    """
+    A row predicate that, when given a regular expression pattern,
+    holds for rows whose first field matches that pattern. A first
+    field holding a value that is not a str never matches.
+    """
+
+    pattern: str
+
+    def __call__(self, row: List[Any]) -> bool:
+        return (
+            len(row) > 0
+            and isinstance(row[0], str)
+            and bool(regexutils.compile_pattern(self.pattern).match(row[0]))
+        )
+
+
+# Every field of the row is blank
+is_blank_row = IsBlankRow()
+
+first_cell_matches = FirstCellMatches
@@ -17,6 +17,7 @@ def read_local(
     path_or_str: Union[str, Path],
     override_reader: Optional[BaseReader] = None,
     override_selectable: Optional[Selectable] = None,
+    **kwargs,
 ) -> Selectable:
     """
     Reads an input from a local file.
@@ -28,6 +29,9 @@ def read_local(
     override_selectable. This is to given an advacned user
     some control over the palette of selection methods made
     availible for a given source.
+
+    Any further keyword arguments are passed to the parse method of
+    the reader, eg: sparse=True for a csv.
     """
 
     input_path: Path = fileutils.ensure_existing_path(path_or_str)
@@ -40,5 +44,5 @@ def read_local(
             handler_insantiated: BaseReader = LocalCsvReader(input_path)
 
     if override_selectable:
-        return handler_insantiated.parse(selectable=override_selectable)
-    return handler_insantiated.parse()
+        return handler_insantiated.parse(selectable=override_selectable, **kwargs)
+    return handler_insantiated.parse(**kwargs)
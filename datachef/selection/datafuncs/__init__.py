@@ -18,14 +18,18 @@ from .common import (
     maximum_y_offset,
     minimum_x_offset,
     minimum_y_offset,
+    positional_extents,
     specific_cell_from_xy,
+    xy_coordinates,
 )
 from .excel import (
     any_excel_ref_as_wanted_basecells,
     assert_excel_ref_within_cells,
     basecell_to_excel_ref,
     basecells_to_excel_ref,
+    excel_region_to_bounds,
     multi_excel_ref_to_basecells,
+    multi_excel_ref_to_bounds,
     single_excel_column_to_x_index,
     single_excel_ref_to_basecell,
     single_excel_row_to_y_index,
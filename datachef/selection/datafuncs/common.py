@@ -1,7 +1,7 @@
 """
 Common data functions that do not fall into any of the other categories.
 """
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from datachef.exceptions import CellsDoNotExistError
 from datachef.models.source.cell import BaseCell
@@ -46,9 +46,10 @@ def cells_not_in(
     Given two lists of cells. Return a List[BaseCell] representing
     initial_cells minus any cells from without_cells
     """
-    return [
-        c1 for c1 in initial_cells if not any(c1.matches_xy(c2) for c2 in without_cells)
-    ]
+    if without_cells:
+        _confirm_none_virtual(initial_cells)
+    without_xy = xy_coordinates(without_cells)
+    return [c for c in initial_cells if (c.x, c.y) not in without_xy]
 
 
 def cells_on_x_index(cells: List[BaseCell], x_index: int) -> List[BaseCell]:
@@ -130,7 +131,10 @@ def matching_xy_cells(
 
     :param cells: Representing a selection from a tabular data source.
     """
-    return [c1 for c1 in cells if any(c1.matches_xy(c2) for c2 in wanted_cells)]
+    if wanted_cells:
+        _confirm_none_virtual(cells)
+    wanted_xy = xy_coordinates(wanted_cells)
+    return [c for c in cells if (c.x, c.y) in wanted_xy]
 
 
 def maximum_x_offset(cells: List[BaseCell]) -> int:
@@ -191,6 +195,50 @@ def specific_cell_from_xy(
     return cells_that_match[0]
 
 
+def positional_extents(
+    positions: List[int], lines: Sequence[int], offsets: Sequence[int]
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Given the positions of cells within a table along with the columns of
+    line (x or y) and offset (y or x) indicies for that table, return the
+    lowest and highest offset in use on each line that holds at least one
+    of the cells.
+
+    eg: with lines of x and offsets of y, for each used x index, returns the
+    uppermost and lowermost y index in use in that column.
+    """
+    extents: Dict[int, Tuple[int, int]] = {}
+    for position in positions:
+        line = lines[position]
+        offset = offsets[position]
+        extent = extents.get(line)
+        if extent is None:
+            extents[line] = (offset, offset)
+        elif offset < extent[0]:
+            extents[line] = (offset, extent[1])
+        elif offset > extent[1]:
+            extents[line] = (extent[0], offset)
+    return extents
+
+
+def _confirm_none_virtual(cells: List[BaseCell]):
+    """
+    Given a list of cells, raise NonExistentCellComparissonError where
+    any is a virtual cell, so cannot be compared by position.
+    """
+    for cell in cells:
+        if cell.x is None or cell.y is None:
+            cell._confirm_not_virtual()
+
+
+def xy_coordinates(cells: List[BaseCell]) -> FrozenSet[Tuple[int, int]]:
+    """
+    Given a list of cells, return the set of (x, y) co-ordinates
+    they occupy, for constant time positional membership checks.
+    """
+    return frozenset((c.x, c.y) for c in cells)
+
+
 def all_used_x_indicies(cells: List[BaseCell]) -> List[int]:
     """
     Given a list of cells, return each unique x indicies
@@ -2,7 +2,7 @@
 Data functions related to excel referencing of x.y positioned cells.
 """
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 from pyrsistent import s
 
@@ -91,6 +91,22 @@ def multi_excel_ref_to_basecells(excel_ref: str) -> List[BaseCell]:
     Given an excel reference referring to multiple cells, return a list of
     wanted BaseCells.
     """
+    min_x, max_x, min_y, max_y = multi_excel_ref_to_bounds(excel_ref)
+
+    return_cells = []
+    for x_index in range(min_x, max_x + 1):
+        for y_index in range(min_y, max_y + 1):
+            return_cells.append(BaseCell(x=x_index, y=y_index))
+
+    return return_cells
+
+
+def multi_excel_ref_to_bounds(excel_ref: str) -> Tuple[int, int, int, int]:
+    """
+    Given an excel reference referring to multiple cells, return the
+    minimum x, maximum x, minimum y and maximum y indicies of the
+    rectangle of wanted cells.
+    """
 
     assert ":" in excel_ref
     start_cell = single_excel_ref_to_basecell(excel_ref.split(":")[0])
@@ -99,17 +115,41 @@ def multi_excel_ref_to_basecells(excel_ref: str) -> List[BaseCell]:
     if start_cell.x > end_cell.x or start_cell.y > end_cell.y:
         raise ReversedExcelRefError()
 
-    start_x = start_cell.x
-    start_y = start_cell.y
-    end_x = end_cell.x
-    end_y = end_cell.y
+    return start_cell.x, end_cell.x, start_cell.y, end_cell.y
 
-    return_cells = []
-    for x_index in range(start_x, end_x + 1):
-        for y_index in range(start_y, end_y + 1):
-            return_cells.append(BaseCell(x=x_index, y=y_index))
 
-    return return_cells
+def excel_region_to_bounds(
+    excel_ref: str,
+) -> Tuple[int, Optional[int], int, Optional[int]]:
+    """
+    Given an excel reference to a region of a sheet, either a rectangle
+    of cells (eg: "A1:M2000"), whole columns (eg: "A:M") or whole rows
+    (eg: "1:2000"), return the minimum x, maximum x, minimum y and maximum
+    y indicies of the region, maximums being None where unbounded.
+    """
+
+    if re.match("^[A-Z]+[0-9]+:[A-Z]+[0-9]+$", excel_ref):
+        return multi_excel_ref_to_bounds(excel_ref)
+
+    if re.match("^[A-Z]+:[A-Z]+$", excel_ref):
+        start, end = excel_ref.split(":")
+        min_x = single_excel_column_to_x_index(start)
+        max_x = single_excel_column_to_x_index(end)
+        if min_x > max_x:
+            raise ReversedExcelRefError()
+        return min_x, max_x, 0, None
+
+    if re.match("^[0-9]+:[0-9]+$", excel_ref):
+        start, end = excel_ref.split(":")
+        min_y = single_excel_row_to_y_index(start)
+        max_y = single_excel_row_to_y_index(end)
+        if min_y > max_y:
+            raise ReversedExcelRefError()
+        return 0, None, min_y, max_y
+
+    raise BadExcelReferenceError(
+        f"Could not identify the region of excel reference {excel_ref}"
+    )
 
 
 def basecell_to_excel_ref(cell: BaseCell) -> str:
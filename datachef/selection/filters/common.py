@@ -2,9 +2,12 @@
 Common filters.
 """
 
+import math
 from dataclasses import dataclass
 
-from datachef.models.source.cell import Cell
+from datachef.models.source.cell import Cell, value_as_number
+from datachef.models.source.table import Table
+from datachef.utils import maskutils
 
 
 @dataclass
@@ -19,16 +22,53 @@ class ContainsString:
     def __call__(self, cell: Cell):
         return self.substr in cell.value
 
+    def mask(self, table: Table) -> int:
+        """
+        Filter a whole table at once, returning a mask of the
+        positions of the cells whose value contains the string.
+        """
+        return table.substring_mask(self.substr)
 
-def is_numeric(cell: Cell):
+
+@dataclass
+class IsNumeric:
     """
-    The value of the cell is numerical
+    A filter that filters cells based on whether the cells
+    value can be regarded as a number, a plain signed decimal
+    such as "12" or "-0.5" (see value_as_number).
     """
-    return cell.value.strip().isnumeric()
+
+    def __call__(self, cell: Cell):
+        return not math.isnan(value_as_number(cell.value))
+
+    def mask(self, table: Table) -> int:
+        """
+        Filter a whole table at once, returning a mask of the
+        positions of the cells with a numeric value.
+        """
+        return table.numeric_mask()
 
 
-def is_not_numeric(cell: Cell):
+@dataclass
+class IsNotNumeric:
     """
-    The value of the cell is not numerical
+    A filter that filters cells based on whether the cells
+    value cannot be regarded as a number (see value_as_number).
     """
-    return not cell.value.strip().isnumeric()
+
+    def __call__(self, cell: Cell):
+        return math.isnan(value_as_number(cell.value))
+
+    def mask(self, table: Table) -> int:
+        """
+        Filter a whole table at once, returning a mask of the
+        positions of the cells without a numeric value.
+        """
+        return maskutils.full_mask(len(table)) & ~table.numeric_mask()
+
+
+# The value of the cell is numerical
+is_numeric = IsNumeric()
+
+# The value of the cell is not numerical
+is_not_numeric = IsNotNumeric()
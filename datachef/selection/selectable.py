@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-import copy
+import bisect
 import re
-from typing import FrozenSet, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from datachef.cardinal.directions import Direction, down, left, right, up
 from datachef.exceptions import (
     BadExcelReferenceError,
     BadShiftParameterError,
+    CellsDoNotExistError,
     LoneValueOnMultipleCellsError,
     OutOfBoundsError,
 )
 from datachef.models.source.cell import BaseCell, Cell
 from datachef.models.source.table import LiveTable
 from datachef.selection import datafuncs as dfc
-from datachef.utils.decorators import dontmutate
+from datachef.utils import maskutils
+from datachef.utils.decorators import deferrable, dontmutate
 
 
 class Selectable(LiveTable):
@@ -39,6 +41,9 @@ class Selectable(LiveTable):
             raise LoneValueOnMultipleCellsError(len(self.cells))
         return self.cells[0].value
 
+    # Not reorderable when lazy, as whether the blank checks raise
+    # depends upon what else is selected.
+    @deferrable()
     @dontmutate
     def is_blank(self, disregard_whitespace=True):
         """
@@ -47,9 +52,11 @@ class Selectable(LiveTable):
         considered blank. You can change this behaviour
         with the disregard_whitespace keyword.
         """
-        self.cells = [x for x in self.cells if x.is_blank(disregard_whitespace)]
+        self.pristine.check_blankable(self.mask)
+        self.mask = self.mask & self.pristine.blank_mask(disregard_whitespace)
         return self
 
+    @deferrable()
     @dontmutate
     def is_not_blank(self, disregard_whitespace=True):
         """
@@ -58,9 +65,96 @@ class Selectable(LiveTable):
         considered blank. You can change this behaviour
         with the disregard_whitespace keyword.
         """
-        self.cells = [x for x in self.cells if x.is_not_blank(disregard_whitespace)]
+        self.pristine.check_blankable(self.mask)
+        self.mask = self.mask & ~self.pristine.blank_mask(disregard_whitespace)
         return self
 
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_exactly(self, value: str):
+        """
+        Filters the selection to those cells whose value
+        is exactly the provided value.
+        """
+        self.mask = self.mask & self.pristine.value_mask([value])
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_one_of(self, values: Iterable[str]):
+        """
+        Filters the selection to those cells whose value
+        is exactly any one of the provided values.
+        """
+        self.mask = self.mask & self.pristine.value_mask(values)
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_numeric(self):
+        """
+        Filters the selection to those cells with a value
+        that can be regarded as a number, a plain signed decimal
+        such as "12" or "-0.5" (not "1e3" or "1,000").
+        """
+        self.mask = self.mask & self.pristine.numeric_mask()
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_not_numeric(self):
+        """
+        Filters the selection to those cells with a value
+        that cannot be regarded as a number.
+        """
+        self.mask = self.mask & ~self.pristine.numeric_mask()
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_integer(self):
+        """
+        Filters the selection to those cells with a
+        value that is a whole number, eg: "12", "3.0"
+        """
+        self.mask = self.mask & self.pristine.integer_mask()
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_greater_than(self, number: float):
+        """
+        Filters the selection to those cells with a numeric
+        value greater than the provided number.
+        """
+        self.mask = self.mask & self.pristine.numeric_mask(
+            minimum=number, inclusive=False
+        )
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_less_than(self, number: float):
+        """
+        Filters the selection to those cells with a numeric
+        value less than the provided number.
+        """
+        self.mask = self.mask & self.pristine.numeric_mask(
+            maximum=number, inclusive=False
+        )
+        return self
+
+    @deferrable(restricts=True)
+    @dontmutate
+    def is_between(self, minimum: float, maximum: float):
+        """
+        Filters the selection to those cells with a numeric value
+        between the minimum and maximum provided (inclusive).
+        """
+        self.mask = self.mask & self.pristine.numeric_mask(minimum, maximum)
+        return self
+
+    @deferrable()
     @dontmutate
     def expand(self, direction: Direction):
         """
@@ -72,69 +166,39 @@ class Selectable(LiveTable):
         are aliases of UP and DOWN respectively.
         """
 
-        potential_cells: List[Cell] = dfc.cells_not_in(self.pcells, self.cells)
+        xs = self.pristine.xs
+        ys = self.pristine.ys
 
-        selection: List[BaseCell] = []
+        lines, extents = {}, {}
         if direction in [up, down]:  # so also above and below
-
-            all_used_x_indicies: FrozenSet[int] = set(c.x for c in self.cells)
-            for xi in all_used_x_indicies:
-                selected_cells_on_xi = dfc.cells_on_x_index(self.cells, xi)
-
-                potential_cells_on_xi: List[Cell] = [
-                    c for c in potential_cells if c.x == xi
-                ]
-
-                if direction == up:
-                    uppermost_used_yi = dfc.minimum_y_offset(selected_cells_on_xi)
-                    selection += [
-                        c
-                        for c in potential_cells_on_xi
-                        if c.is_above(uppermost_used_yi)
-                    ]
-
-                if direction == down:
-                    lowest_used_xi = dfc.maximum_y_offset(selected_cells_on_xi)
-                    selection += [
-                        c for c in potential_cells_on_xi if c.is_below(lowest_used_xi)
-                    ]
+            # For every column with at least one cell selected, the cells
+            # of that column (ordered by y) and the extent of the selection
+            lines = self.pristine.column_index
+            extents = dfc.positional_extents(self.positions, xs, ys)
 
         if direction in [left, right]:
-
-            # For every row in which have at least one cell selected
-            all_used_y_indicies: FrozenSet[int] = set(c.y for c in self.cells)
-            for yi in all_used_y_indicies:
-
-                # Get all currently selected cells on that row
-                selected_cells_on_yi = dfc.cells_on_y_index(self.cells, yi)
-
-                # Get all not selected cells on that row
-                potential_cells_on_yi: List[Cell] = [
-                    c for c in potential_cells if c.y == yi
-                ]
-
-                if direction == left:
-
-                    # Select anything to the left of the
-                    # rightmost of the selected cells on this row
-                    leftmost_used_yi = dfc.minimum_x_offset(selected_cells_on_yi)
-                    selection += [
-                        c
-                        for c in potential_cells_on_yi
-                        if c.is_left_of(leftmost_used_yi)
-                    ]
-
-                if direction == right:
-                    rightmost_used_yi = dfc.maximum_x_offset(selected_cells_on_yi)
-                    selection += [
-                        c
-                        for c in potential_cells_on_yi
-                        if c.is_right_of(rightmost_used_yi)
-                    ]
-
-        self.cells += selection
+            # For every row with at least one cell selected, the cells
+            # of that row (ordered by x) and the extent of the selection
+            lines = self.pristine.row_index
+            extents = dfc.positional_extents(self.positions, ys, xs)
+
+        selection: List[int] = []
+        for line, (lowest, highest) in extents.items():
+            offsets, positions = lines[line]
+
+            # Select anything before the first or after the last
+            # of the selected cells on this line
+            if direction in [up, left]:
+                selection += positions[: bisect.bisect_left(offsets, lowest)]
+            else:
+                selection += positions[bisect.bisect_right(offsets, highest) :]
+
+        self.mask = self.mask | maskutils.positions_to_mask(
+            selection, len(self.pristine)
+        )
         return self
 
+    @deferrable()
     @dontmutate
     def fill(self, direction: Direction):
         """
@@ -143,11 +207,15 @@ class Selectable(LiveTable):
 
         :direction: One of: up, down, left, right
         """
-        did_have = copy.deepcopy(self.cells)
+        did_have = self.mask
         self = self.expand(direction)
-        self.cells = [x for x in self.cells if x not in did_have]
+
+        # Positional difference, the cells expanded into less
+        # the cells we started with
+        self.mask = self.mask & ~did_have
         return self
 
+    @deferrable()
     @dontmutate
     def shift(
         self,
@@ -182,18 +250,19 @@ class Selectable(LiveTable):
         else:
             raise BadShiftParameterError()
 
-        wanted_cells: List[BaseCell] = [
-            BaseCell(x=c.x + x_offset, y=c.y + y_offset) for c in self.cells
-        ]
-
-        found_cells = dfc.matching_xy_cells(self.pcells, wanted_cells)
+        found_cells: List[Cell] = []
+        for c in self.cells:
+            found = self.pcell_at(c.x + x_offset, c.y + y_offset)
+            if found is not None:
+                found_cells.append(found)
 
-        if len(found_cells) == 0 and len(wanted_cells) > 0:
+        if len(found_cells) == 0 and len(self.cells) > 0:
             raise OutOfBoundsError()
 
         self.cells = found_cells
         return self
 
+    @deferrable()
     @dontmutate
     def excel_ref(self, excel_ref: str):
         """
@@ -204,35 +273,65 @@ class Selectable(LiveTable):
         # Multi excel reference:
         # eg: 'B2:F5'
         if re.match("^[A-Z]+[0-9]+:[A-Z]+[0-9]+$", excel_ref):
-            wanted: List[BaseCell] = dfc.multi_excel_ref_to_basecells(excel_ref)
-            selected = dfc.exactly_matched_xy_cells(self.cells, wanted)
+            bounds = dfc.multi_excel_ref_to_bounds(excel_ref)
+            self.mask = self._mask_within(*bounds)
 
         # Single column and row reference
         # eg: 'F19'
         elif re.match("^[A-Z]+[0-9]+$", excel_ref):
             wanted: BaseCell = dfc.single_excel_ref_to_basecell(excel_ref)
-            wanted = [wanted]
-            selected = dfc.exactly_matched_xy_cells(self.cells, wanted)
+            self.mask = self._mask_within(wanted.x, wanted.x, wanted.y, wanted.y)
 
         # An excel reference that is a single row number
         # eg: '4'
         elif re.match("^[0-9]+$", excel_ref):
             wanted_y_index: int = dfc.single_excel_row_to_y_index(excel_ref)
-            selected = [c for c in self.cells if c.y == wanted_y_index]
+            _, positions = self.pristine.row_index.get(wanted_y_index, (None, []))
+            self.mask = self.mask & maskutils.positions_to_mask(
+                positions, len(self.pristine)
+            )
 
         # An excel reference that is one of more column letter
         # eg: 'H'
         elif re.match("^[A-Z]+$", excel_ref):
             wanted_x_index: int = dfc.single_excel_column_to_x_index(excel_ref)
-            selected = [c for c in self.cells if c.x == wanted_x_index]
+            _, positions = self.pristine.column_index.get(wanted_x_index, (None, []))
+            self.mask = self.mask & maskutils.positions_to_mask(
+                positions, len(self.pristine)
+            )
 
         # Unknown excel reference
         else:
             raise BadExcelReferenceError(f"Unrecognised excel reference {excel_ref}")
 
-        self.cells = selected
         return self
 
+    def _mask_within(self, min_x: int, max_x: int, min_y: int, max_y: int) -> int:
+        """
+        Return the mask of the currently selected cells that fall
+        within the given rectangle of x and y indicies.
+
+        Raises CellsDoNotExistError if any cell of the rectangle is
+        not in the current selection.
+        """
+        positions = self.pristine.positions_within(min_x, max_x, min_y, max_y)
+        within = self.mask & maskutils.positions_to_mask(positions, len(self.pristine))
+
+        # Every wanted cell exists if we have one selected cell per
+        # x and y combination in the rectangle
+        wanted_count = (max_x - min_x + 1) * (max_y - min_y + 1)
+        if maskutils.count_positions(within) != wanted_count:
+            wanted = [
+                BaseCell(x=x, y=y)
+                for x in range(min_x, max_x + 1)
+                for y in range(min_y, max_y + 1)
+            ]
+            found = self.pristine.cells_at(maskutils.mask_to_positions(within))
+            raise CellsDoNotExistError(dfc.cells_not_in(wanted, found))
+
+        return within
+
+    @deferrable(restricts=True)
     @dontmutate
     def filter(self, check: callable):
         """
@@ -240,21 +339,27 @@ class Selectable(LiveTable):
 
         : param check: a function, lambda or callable class that
         returns a bool when given a single cell as a parameter.
+
+        Where the check also has a mask method, that is given the
+        source table and used instead to filter every cell at once.
         """
 
-        self.cells = list(filter(check, self.cells))
+        if callable(getattr(check, "mask", None)):
+            self.mask = self.mask & check.mask(self.pristine)
+        else:
+            self.cells = list(filter(check, self.cells))
         return self
 
-    # Decorator unnecessary as we're calling another decorated method
+    @deferrable(restricts=True)
+    @dontmutate
     def re(self, pattern: str):
         """
         Filter the current selection of cells to only include
         cells whose value matches the provided regular expression
         pattern.
         """
-        return self.filter(
-            lambda cell: True if re.match(pattern, cell.value) else False
-        )
+        self.mask = self.mask & self.pristine.pattern_mask(pattern)
+        return self
 
     @dontmutate
     def spread(self, direction: Direction, until: Optional[Selectable] = None):
@@ -277,67 +382,64 @@ class Selectable(LiveTable):
                 "left, right, above, below"
             )
 
-        new_cells = []
-
-        orderer = {
-            "right": dfc.order_cells_leftright_topbottom,
-            "left": dfc.order_cells_rightleft_bottomtop,
-            "up": dfc.order_cells_bottomtop_rightleft,
-            "above": dfc.order_cells_bottomtop_rightleft,
-            "down": dfc.order_cells_topbottom_leftright,
-            "below": dfc.order_cells_topbottom_leftright,
+        # Whether we walk along rows (else columns) and whether
+        # we walk each line in reverse
+        walk = {
+            "right": (True, False),
+            "left": (True, True),
+            "up": (False, True),
+            "above": (False, True),
+            "down": (False, False),
+            "below": (False, False),
         }.get(direction.name)
 
-        if not orderer:
+        if not walk:
             raise ValueError(
                 "Unable to determine required cell consideration"
                 f" order from direction: {direction}"
             )
+        along_rows, reverse = walk
+        lines = self.pristine.row_index if along_rows else self.pristine.column_index
+
+        selected = set(self.positions)
+        blank = set(maskutils.mask_to_positions(self.pristine.blank_mask()))
+        if not until:
+            barrier = set()
+        elif until.signature == self.signature:
+            barrier = set(until.positions)
+        else:
+            barrier = set(self.pristine.positions_of(until.cells))
 
-        ordered_selected_cells: List[Cell] = orderer(self.cells)
-        ordered_pristine_cells: List[Cell] = copy.deepcopy(orderer(self.pcells))
-
-        selected_cell_index: int = 0
-        considered_offset = None
-        spreading = None
-        for cell in ordered_pristine_cells:
-
-            if considered_offset is None:
-                considered_offset = cell.y if direction._horizontal_axis else cell.x
-            elif considered_offset != (
-                cell.y if direction._horizontal_axis else cell.x
-            ):
-                spreading = None
-                considered_offset = cell.y if direction._horizontal_axis else cell.x
-
-            if not (selected_cell_index + 1) > len(ordered_selected_cells):
-                if cell.matches_xy(ordered_selected_cells[selected_cell_index]):
-                    spreading = cell.value
-                    selected_cell_index += 1
+        # Walk every row or column once, in the direction of the spread
+        new_values: Dict[int, str] = {}
+        for _, line_positions in lines.values():
+            spreading = None
+            for position in reversed(line_positions) if reverse else line_positions:
+
+                if position in selected:
+                    spreading = self.pristine.value_at(position)
                     continue
 
-            if spreading is not None:
-                if until:
-                    if any(cell.matches_xy(c) for c in until.cells):
+                if spreading is not None:
+                    if position in barrier:
                         spreading = None
                         continue
-                if cell.is_blank():
-                    cell.value = spreading
-                    new_cells.append(cell)
-                else:
-                    spreading = None
-
-        # Remove cells we're overwriting
-        self.cells = [
-            c1 for c1 in self.cells if not any(c1.matches_xy(c2) for c2 in new_cells)
-        ]
-
-        # We also need to modify the pristine selection
-        self.pristine.cells = [
-            c1 for c1 in self.pcells if not any(c1.matches_xy(c2) for c2 in new_cells)
-        ]
-        self.pristine.cells += new_cells
+                    if position in blank:
+                        new_values[position] = spreading
+                    else:
+                        self.pristine.check_blankable(1 << position)
+                        spreading = None
+
+        # Write the spread values into the pristine table, the
+        # cells keep their positions so existing masks stay valid.
+        # The pristine table is shared with other selections so
+        # we need to take our own copy first.
+        if new_values:
+            self._copy_pristine_on_write()
+            self.pristine.set_values(new_values)
 
         # Add the overwritten cells into the current selection
-        self.cells += new_cells
+        self.mask = self.mask | maskutils.positions_to_mask(
+            new_values, len(self.pristine)
+        )
         return self
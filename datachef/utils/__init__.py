@@ -1 +1 @@
-from . import cellutils, fileutils
+from . import cellutils, fileutils, maskutils, regexutils
@@ -2,4 +2,6 @@
 Decorators in common use throughout the codebase.
 """
 
+from .deferrable import deferrable
 from .dontmutate import dontmutate
+from .slotted import slotted
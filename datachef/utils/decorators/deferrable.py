@@ -0,0 +1,28 @@
+from functools import wraps
+
+
+def deferrable(restricts: bool = False):
+    """
+    Decorates a selection method so that when called on a lazy
+    selection the method is not run, it is instead recorded as
+    a pending operation of a new selection (see LiveTable.lazy).
+
+    Otherwise the method is run, unless the same selection has
+    been made before and can be taken from the memo (see
+    LiveTable._call).
+
+    :param restricts: the method only ever narrows a selection
+    down, by a criteria that does not depend on the rest of the
+    selection, so can be reordered amongst other such methods.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self._lazy:
+                return self._defer(method, args, kwargs, restricts)
+            return self._call(method, args, kwargs)
+
+        return wrapper
+
+    return decorator
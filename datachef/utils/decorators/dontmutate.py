@@ -12,11 +12,16 @@ def dontmutate(method):
 
     Would change the value of f1 as well as assigning
     said new value to f2.
+
+    The copy is shallow, so f1 and f2 share whatever f1
+    references. Anything shared is expected to be treated
+    as immutable (copied on write) by the decorated method,
+    see the __copy__ method of the class in question.
     """
 
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        self = copy.deepcopy(self)
+        self = copy.copy(self)
         return method(self, *args, **kwargs)
 
     return wrapper
@@ -0,0 +1,29 @@
+import dataclasses
+
+
+def slotted(cls):
+    """
+    Decorates a dataclass so that its fields are held in __slots__
+    rather than a per instance __dict__.
+
+    This is the equivalent of dataclass(slots=True), which is not
+    availible prior to python 3.10. Must be applied above (i.e after)
+    the dataclass decorator.
+    """
+
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, "__slots__", ()))
+
+    field_names = [f.name for f in dataclasses.fields(cls)]
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = tuple(f for f in field_names if f not in inherited)
+
+    # Field defaults are held in the generated __init__, as class
+    # attributes they would clash with the slots of the same name
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
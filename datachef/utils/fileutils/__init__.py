@@ -1,2 +1,3 @@
 from .inputs import identify_local_input_type
 from .paths import ensure_existing_path
+from .rows import csv_chunk_offsets, csv_row_end, csv_row_index, decode_csv_row
@@ -0,0 +1,166 @@
+import csv
+import itertools
+import re
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from datachef.constants.files import CSV_BUFFER_SIZE
+
+
+def csv_row_end(
+    data: bytes, position: int, end: Optional[int] = None, in_quotes: bool = False
+) -> int:
+    """
+    Return the byte offset just after the row of the csv held in
+    data (bytes or a memory map) that begins at position, so the
+    offset of the row that follows it.
+
+    A newline within a quoted field does not end a row, this is
+    detected by an odd number of quote characters preceding it on
+    the row (an escaped quote being two quote characters).
+
+    :param in_quotes: Where True, position is within a quoted field.
+    """
+    end = len(data) if end is None else end
+    while True:
+        newline = data.find(b"\n", position, end)
+        if newline == -1:
+            return end
+        quote = data.find(b'"', position, newline)
+        while quote != -1:
+            in_quotes = not in_quotes
+            quote = data.find(b'"', quote + 1, newline)
+        position = newline + 1
+        if not in_quotes:
+            return position
+
+
+# A line of a csv as a csv file opened with newline="" would give it,
+# ending with \r\n, \r or \n (or the end of the data)
+_LINE = re.compile(rb"[^\r\n]*(?:\r\n?|\n)|[^\r\n]+")
+
+
+def csv_rows(
+    data: bytes, delimiter: str = ",", start: int = 0, end: Optional[int] = None
+) -> Iterator[Tuple[int, int]]:
+    """
+    Parse the csv held in data (bytes or a memory map) from the start
+    offset, which must be the start of a row, yielding for each row
+    the byte offset just after it and the number of fields on it.
+
+    Rows are found by a csv.reader fed the data a line at a time, so
+    are exactly those it would find reading the file in text mode.
+    """
+    end = len(data) if end is None else end
+    consumed = start
+
+    def lines() -> Iterator[str]:
+        nonlocal consumed
+        for line in _LINE.finditer(data, start, end):
+            consumed = line.end()
+            yield line.group().decode("utf8")
+
+    for row in csv.reader(lines(), delimiter=delimiter):
+        yield consumed, len(row)
+
+
+def csv_row_index(
+    data: bytes,
+    delimiter: str = ",",
+    start: int = 0,
+    end: Optional[int] = None,
+    block_size: int = CSV_BUFFER_SIZE,
+) -> Tuple[array, array]:
+    """
+    Index the rows of the csv held in data (bytes or a memory map)
+    between the provided start and end offsets, returning a tuple of:
+
+    - the byte offset at which each row begins, followed by the end
+    offset itself, so row i is held by data[offsets[i]:offsets[i + 1]].
+    - the number of fields on each row.
+
+    The data is indexed a block of rows at a time. A block without a
+    quote character in it cannot have a newline within a field, so
+    (where its lines all end with \n or \r\n) it is split into rows,
+    and the delimiters of each row counted, directly. Otherwise the
+    rows of the block are found by parsing it, see csv_rows.
+
+    Note: start is assumed to be the start of a row.
+    """
+    end = len(data) if end is None else end
+    offsets = array("q")
+    widths = array("i")
+    separator = delimiter.encode("utf8")
+
+    position = start
+    while position < end:
+        block_end = data.rfind(b"\n", position, min(position + block_size, end)) + 1
+        block = data[position:block_end]
+
+        if block and b'"' not in block and block.count(b"\r") == block.count(b"\r\n"):
+            rows = block.split(b"\n")
+            rows.pop()
+            offsets.extend(
+                itertools.accumulate(
+                    (len(row) + 1 for row in rows[:-1]), initial=position
+                )
+            )
+            widths.extend(
+                row.count(separator) + 1 if row.strip(b"\r") else 0 for row in rows
+            )
+            position = block_end
+            continue
+
+        # The last row parsed may run on past the end of the block
+        block_end = max(block_end, position + 1)
+        for row_end, width in csv_rows(data, delimiter, position, end):
+            offsets.append(position)
+            widths.append(width)
+            position = row_end
+            if position >= block_end:
+                break
+
+    offsets.append(max(position, start))
+    return offsets, widths
+
+
+def csv_chunk_offsets(
+    data: bytes, chunks: int, block_size: int = CSV_BUFFER_SIZE
+) -> List[int]:
+    """
+    Split the csv held in data (bytes or a memory map) into the given
+    number of chunks of roughly equal size, returning the byte offset
+    at which each chunk begins followed by the length of the data.
+
+    Every chunk is meant to begin at the start of a row, whether a
+    newline is within a quoted field being taken from the number of
+    quote characters preceding it (counted a block at a time) being odd.
+
+    Note: quote characters are assumed to appear in quoted fields only,
+    where they appear elsewhere a chunk can begin within a field, so
+    the caller must check that each chunk ends at the end of a row.
+    """
+    end = len(data)
+    offsets = [0]
+    quotes = counted = 0
+    for chunk in range(1, chunks):
+        target = max(end * chunk // chunks, offsets[-1])
+        while counted < target:
+            upto = min(counted + block_size, target)
+            quotes += data[counted:upto].count(b'"')
+            counted = upto
+        offsets.append(csv_row_end(data, target, end, in_quotes=bool(quotes % 2)))
+    offsets.append(end)
+    return offsets
+
+
+def decode_csv_row(row: bytes, delimiter: str = ",") -> List[str]:
+    """
+    Decode the bytes of a single csv row (as given by
+    csv_row_index) into the values of its fields, as a
+    csv.reader reading the file in text mode would.
+    """
+    text = row.decode("utf8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return next(csv.reader([text], delimiter=delimiter), [])
@@ -0,0 +1 @@
+from .masks import count_positions, full_mask, mask_to_positions, positions_to_mask
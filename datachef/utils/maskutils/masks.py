@@ -0,0 +1,50 @@
+"""
+Helpers for working with selection masks.
+
+A selection mask is an int used as a bitset, where bit n being set
+denotes that the cell at position n of a pristine table is selected.
+Python ints give us arbitrary width along with bitwise and (&), or (|)
+and difference (& ~) implemented in C, so set algebra between
+selections is a handful of word operations rather than a cell scan.
+"""
+
+from typing import Iterable, List
+
+
+def full_mask(size: int) -> int:
+    """
+    Return a mask with every position from 0 to size - 1 set.
+    """
+    return (1 << size) - 1
+
+
+def positions_to_mask(positions: Iterable[int], size: int) -> int:
+    """
+    Given the positions of cells within a table of the given
+    size, return the mask with those positions set.
+    """
+    bits = bytearray((size >> 3) + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def mask_to_positions(mask: int) -> List[int]:
+    """
+    Given a mask, return the positions that are set in
+    ascending order.
+    """
+    bits = bin(mask)[:1:-1]
+    positions = []
+    position = bits.find("1")
+    while position != -1:
+        positions.append(position)
+        position = bits.find("1", position + 1)
+    return positions
+
+
+def count_positions(mask: int) -> int:
+    """
+    Given a mask, return the number of positions that are set.
+    """
+    return bin(mask).count("1")
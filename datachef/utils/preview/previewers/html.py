@@ -12,7 +12,6 @@ from IPython.display import HTML, display
 
 from datachef.exceptions import UnnamedTableError
 from datachef.models.source.cell import Cell
-from datachef.selection import datafuncs as dfc
 from datachef.selection.selectable import Selectable
 from datachef.utils import cellutils
 
@@ -111,9 +110,7 @@ class HtmlPreview(BasePreview):
         td_unselected = "<td>{value}</td>"
         td_selected = '<td style="background-color:{colour}">{value}</td>'
 
-        all_cells: List[Cell] = dfc.order_cells_leftright_topbottom(
-            selections[0].pcells
-        )
+        all_cells: List[Cell] = selections[0].pristine.ordered_cells()
 
         # ------------------
         # Cell lookup logic
@@ -144,7 +141,7 @@ class HtmlPreview(BasePreview):
         for i, s in enumerate(selections):
 
             if s.selections_made():
-                selected_cells = deque(dfc.order_cells_leftright_topbottom(s.cells))
+                selected_cells = deque(s.ordered_cells())
             else:
                 selected_cells = deque([])
 
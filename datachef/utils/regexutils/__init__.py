@@ -0,0 +1,2 @@
+from .literals import NGRAM_LENGTH, ngrams, required_literal
+from .patterns import compile_pattern
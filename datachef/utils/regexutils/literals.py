@@ -0,0 +1,83 @@
+"""
+Helpers for finding the literal text a regular expression requires,
+so candidate values can be narrowed down before the expression is run.
+"""
+
+from typing import List, Set
+
+# The length of the n-grams we index text by
+NGRAM_LENGTH = 3
+
+# Characters that make the preceding character optional
+_OPTIONAL_QUANTIFIERS = "*?{"
+
+
+def ngrams(text: str, n: int = NGRAM_LENGTH) -> Set[str]:
+    """
+    Return the set of every run of n consecutive characters
+    within the provided text.
+    """
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def required_literal(pattern: str) -> str:
+    """
+    Return the longest run of literal characters that any value
+    matching the provided pattern must contain, or "" where no such
+    run can be determined.
+
+    This is deliberately conservative. Only characters outside of any
+    group are considered, and patterns with alternation or inline
+    flags (which may make the match case insensitive) are not
+    considered at all.
+    """
+    if "|" in pattern or "(?" in pattern:
+        return ""
+
+    runs: List[str] = []
+    run = ""
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 2
+            if depth == 0 and not escaped.isalnum():
+                run += escaped
+            else:
+                runs.append(run)
+                run = ""
+            continue
+
+        if char == "[":
+            # Skip the character class, a "]" straight after the
+            # opening "[" or "[^" is a member of the class
+            i += 1
+            if pattern[i : i + 1] == "^":
+                i += 1
+            if pattern[i : i + 1] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and char in _OPTIONAL_QUANTIFIERS:
+            run = run[:-1]
+            if char == "{":
+                closing = pattern.find("}", i)
+                i = closing if closing != -1 else i
+        elif depth == 0 and char not in "+.^$":
+            run += char
+            i += 1
+            continue
+
+        runs.append(run)
+        run = ""
+        i += 1
+
+    runs.append(run)
+    return max(runs, key=len)
@@ -0,0 +1,19 @@
+"""
+Helpers for working with regular expression patterns.
+"""
+
+import re
+from functools import lru_cache
+
+# The number of distinct patterns we hold compiled at once. Recipes tend
+# to apply the same handful of patterns many times over.
+COMPILED_PATTERN_LIMIT = 256
+
+
+@lru_cache(maxsize=COMPILED_PATTERN_LIMIT)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Return the compiled form of the provided regular expression
+    pattern, each pattern being compiled once only.
+    """
+    return re.compile(pattern)
@@ -4,11 +4,15 @@ from datachef.exceptions import (
     CellsDoNotExistError,
     DimensionConstructionError,
     FailedLookupError,
+    FrozenCellPositionError,
+    IncompatibleReadOptionsError,
     InvlaidCellPositionError,
     MissingDirectLookupError,
     NonExistentCellComparissonError,
+    ReadOnlyTableError,
     UnknownDirectionError,
     UnnamedTableError,
+    UnorderedCellsError,
 )
 
 
@@ -32,6 +36,10 @@ def test_exception_defaults_can_be_overwritten():
             "Cannot access table name/title property as this table does not have one.",
         ),
         Case(UnknownDirectionError, "Direction is not a valid direction."),
+        Case(
+            IncompatibleReadOptionsError,
+            "The provided read options cannot be used together.",
+        ),
         Case(
             MissingDirectLookupError,
             "Cannot use a direct lookup, no value found in the direction specified.",
@@ -51,6 +59,18 @@ def test_exception_defaults_can_be_overwritten():
             InvlaidCellPositionError,
             "A cell with any postional values must exist on both the x and y axis.",
         ),
+        Case(
+            UnorderedCellsError,
+            "Cells must be added to this table in row order",
+        ),
+        Case(
+            ReadOnlyTableError,
+            "Cells cannot be added to a table read directly from a memory",
+        ),
+        Case(
+            FrozenCellPositionError,
+            "The position of a cell cannot be changed once it has been set.",
+        ),
     ]:
 
         # Assert initially as expected
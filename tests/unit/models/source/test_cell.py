@@ -1,11 +1,21 @@
+import copy
+import math
+
 import pytest
 
 from datachef.exceptions import (
+    FrozenCellPositionError,
     InvalidCellObjectError,
     InvlaidCellPositionError,
     NonExistentCellComparissonError,
 )
-from datachef.models.source.cell import Cell, VirtualCell
+from datachef.models.source.cell import (
+    BaseCell,
+    Cell,
+    VirtualCell,
+    value_as_number,
+    value_is_blank,
+)
 from datachef.selection.csv.csv import CsvInputSelectable
 from tests.fixtures import fixture_with_blanks
 
@@ -82,6 +92,33 @@ def test_none_counts_as_blank():
     assert Cell(x=0, y=0, value=None).is_blank()
 
 
+def test_value_is_blank():
+    """
+    Test the value level blank check that cells use.
+    """
+    assert value_is_blank("")
+    assert value_is_blank("   ")
+    assert value_is_blank(None)
+    assert not value_is_blank("   ", disregard_whitespace=False)
+    assert not value_is_blank("foo")
+
+    with pytest.raises(InvalidCellObjectError):
+        value_is_blank(0.5)
+
+
+def test_value_as_number():
+    """
+    Test the value level conversion of cell values to numbers.
+    """
+    assert value_as_number("12") == 12
+    assert value_as_number(" -0.5 ") == -0.5
+    assert value_as_number("+.5") == 0.5
+    assert value_as_number(7) == 7
+
+    for not_a_number in ["", "Total", "inf", "nan", "1e3", "1_000", None, True]:
+        assert math.isnan(value_as_number(not_a_number))
+
+
 def test_cell_xy_str():
     """
     Test our cells can print a simple self reference
@@ -135,3 +172,68 @@ def test_virt_cell_repr():
     """
     vcell = VirtualCell(value="foo")
     assert str(vcell) == '<VIRTUAL CELL, value:"foo">'
+
+
+def test_cells_are_hashable_by_position():
+    """
+    Test that cells hash by position, so can be held in sets
+    and used as dictionary keys.
+    """
+    cell1 = Cell(x=0, y=0, value="foo")
+    cell2 = Cell(x=0, y=1, value="foo")
+
+    assert hash(cell1) == hash(BaseCell(x=0, y=0))
+    assert hash(VirtualCell(value="foo")) == hash(VirtualCell(value="bar"))
+
+    cells = {cell1, cell2}
+    assert Cell(x=0, y=0, value="foo") in cells
+    assert Cell(x=0, y=2, value="foo") not in cells
+    assert {cell1: "bar"}[Cell(x=0, y=0, value="foo")] == "bar"
+
+
+def test_cell_positions_are_frozen():
+    """
+    Test that the value of a cell can be changed but its
+    position cannot.
+    """
+    cell = Cell(x=0, y=0, value="foo")
+    cell.value = "bar"
+    assert cell.value == "bar"
+
+    with pytest.raises(FrozenCellPositionError):
+        cell.x = 1
+
+    with pytest.raises(FrozenCellPositionError):
+        cell.y = 1
+
+    # Copies take the position of the cell copied
+    copied = copy.copy(cell)
+    assert (copied.x, copied.y, copied.value) == (0, 0, "bar")
+    assert copied == cell
+    assert repr(BaseCell(x=0, y=1)) == "BaseCell(x=0, y=1)"
+
+
+def test_cells_are_slotted():
+    """
+    Test that cells hold their attributes in slots rather
+    than a per instance dictionary.
+    """
+    for cell in [BaseCell(x=0, y=0), Cell(x=0, y=0), VirtualCell(value="foo")]:
+        assert not hasattr(cell, "__dict__")
+
+
+def test_cell_positional_comparisons():
+    """
+    Test we can compare the position of a cell against
+    x and y indicies.
+    """
+    cell = Cell(x=2, y=2, value="foo")
+
+    assert cell.is_above(3)
+    assert not cell.is_above(2)
+    assert cell.is_below(1)
+    assert not cell.is_below(2)
+    assert cell.is_left_of(3)
+    assert not cell.is_left_of(2)
+    assert cell.is_right_of(1)
+    assert not cell.is_right_of(2)
@@ -0,0 +1,84 @@
+import pytest
+
+from datachef.models.source.expression import (
+    AllOf,
+    Operation,
+    UndescribableError,
+    describe,
+    describe_call,
+    plan,
+)
+
+
+def filter(selection, check):
+    return selection
+
+
+def narrow(selection):
+    return selection
+
+
+def widen(selection):
+    return selection
+
+
+def test_plan_reorders_and_fuses_restrictions():
+    """
+    Test that planning moves cell by cell checks behind other
+    restrictions and fuses them, without crossing operations
+    that do not restrict.
+    """
+
+    def is_a(cell):
+        return cell == "a"
+
+    def is_b(cell):
+        return cell == "b"
+
+    check_a = Operation(filter, (is_a,), restricts=True)
+    check_b = Operation(filter, (is_b,), restricts=True)
+    narrowing = Operation(narrow, restricts=True)
+    widening = Operation(widen)
+
+    planned = plan([check_a, narrowing, check_b, widening, check_a, narrowing])
+
+    assert planned[0] == narrowing
+    assert planned[1].method is filter
+    assert planned[1].args == (AllOf([is_a, is_b]),)
+    assert planned[2:] == [widening, narrowing, check_a]
+
+    assert not AllOf([is_a, is_b])("a")
+    assert AllOf([is_a])("a")
+    assert plan([]) == []
+
+
+def test_describe():
+    """
+    Test that arguments to selection methods are given canonical
+    descriptions, and that those that cannot be described are not.
+    """
+    assert describe(1) != describe(1.0) != describe(True)
+    assert describe({"b", "a"}) == describe({"a", "b"})
+    assert describe(["a"]) != describe(("a",))
+
+    class Check:
+        def __call__(self, cell):
+            return True
+
+    for undescribable in [
+        is_a_check,
+        Check(),
+        object.__new__(type("Thing", (), {"__hash__": None})),
+    ]:
+        with pytest.raises(UndescribableError):
+            describe(undescribable)
+
+    assert describe_call((), "re", ("^A",), {}) == (
+        ("re", ("tuple", (("str", "^A"),)), ()),
+    )
+    assert describe_call((), "filter", (Check(),), {}) is None
+    assert describe_call(None, "re", ("^A",), {}) is None
+
+
+def is_a_check(cell):
+    return cell == "a"
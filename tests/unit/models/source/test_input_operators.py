@@ -91,3 +91,33 @@ def test_union_operator_raises_for_unaligned_tables(
 
     with pytest.raises(UnalignedTableOperation):
         selectable_simple1 | selectable_simple2
+
+
+def test_intersection_operator(selectable_simple1: Selectable):
+    """
+    Test we can create an intersection of cells from a table selection
+    with another selection taken from the same table.
+    """
+
+    two_rows = selectable_simple1.excel_ref("A1:Z2")
+    column = selectable_simple1.excel_ref("C")
+
+    intersected = two_rows & column
+    assert len(intersected.cells) == 2
+    assert dfc.basecells_to_excel_ref(intersected.cells) == "C1:C2"
+
+    # The operands are not modified
+    assert len(two_rows.cells) == 52
+    assert len(column.cells) == 100
+
+
+def test_intersection_operator_raises_for_unaligned_tables(
+    selectable_simple1: Selectable, selectable_simple2: Selectable
+):
+    """
+    Test that a a suitable error is raised if we try and make an intersection
+    of cells using selections taken from different tables.
+    """
+
+    with pytest.raises(UnalignedTableOperation):
+        selectable_simple1 & selectable_simple2
@@ -0,0 +1,55 @@
+from datachef.models.source.pool import ValuePool
+
+
+def test_value_pool_interns_strings():
+    """
+    Test that equal string values added to a pool are returned
+    as a single shared object.
+    """
+
+    pool = ValuePool()
+    value1 = "".join(["Eng", "land"])
+    value2 = "".join(["Engl", "and"])
+    assert value1 is not value2
+
+    assert pool.intern(value1) is value1
+    assert pool.intern(value2) is value1
+    assert len(pool) == 1
+
+    # Values that are not strings are pooled but returned as is
+    assert pool.intern(1.0) == 1.0
+    assert pool.intern(None) is None
+
+
+def test_value_pool_codes():
+    """
+    Test that each distinct value in a pool has a code, and
+    that we can move between values and codes.
+    """
+
+    pool = ValuePool()
+    assert pool.code("foo") == 0
+    assert pool.code("bar") == 1
+    assert pool.code("foo") == 0
+
+    assert pool.code_of("bar") == 1
+    assert pool.code_of("baz") is None
+    assert pool.value(1) == "bar"
+    assert len(pool) == 2
+
+
+def test_value_pool_interns_many_values():
+    """
+    Test that a sequence of values can be interned at once,
+    as though each had been interned in turn.
+    """
+
+    pool = ValuePool()
+    value1 = "".join(["Eng", "land"])
+    value2 = "".join(["Engl", "and"])
+
+    interned = pool.intern_all([value1, 1.0, value2, None])
+    assert interned == ["England", 1.0, "England", None]
+    assert interned[2] is value1
+    assert pool.code_of(1.0) == 1
+    assert len(pool) == 3
@@ -1,10 +1,25 @@
+import copy
+import math
+
 import pytest
 
-from datachef.exceptions import InvalidTableSignatures, UnnamedTableError
+from datachef.exceptions import (
+    CellsDoNotExistError,
+    InvalidTableSignatures,
+    ReadOnlyTableError,
+    UnnamedTableError,
+    UnorderedCellsError,
+)
+from datachef.models.source.cell import Cell
 from datachef.models.source.input import BaseInput
-from datachef.models.source.table import LiveTable
+from datachef.models.source.table import LiveTable, MappedTable, SparseTable, Table
+from datachef.selection import datafuncs as dfc
 from datachef.selection.selectable import Selectable
-from tests.fixtures import fixture_simple_one_tab, fixture_simple_two_tabs
+from tests.fixtures import (
+    fixture_simple_one_tab,
+    fixture_simple_two_tabs,
+    path_to_fixture,
+)
 
 
 @pytest.fixture
@@ -62,3 +77,604 @@ def test_selectable_name_property_returns_name(selectable_of2_simple1: BaseInput
 
     for tab in selectable_of2_simple1:
         assert "I am table 1" == tab.name or "I am table 2" == tab.name
+
+
+def test_table_xy_index(selectable_simple1: Selectable):
+    """
+    Test that the pristine table can map x and y co-ordinates
+    to the cells it holds.
+    """
+
+    cell = selectable_simple1.pcell_at(3, 4)
+    assert cell.value == "D5val"
+    assert selectable_simple1.pcell_at(300, 4) is None
+
+    assert len(selectable_simple1.pristine.xy_index) == 2600
+
+
+def test_table_xy_index_shared_on_copy(selectable_simple1: Selectable):
+    """
+    Test that a copied table shares the coordinate index of the
+    table it was copied from, but that the index is discarded when
+    the cells of a table are replaced.
+    """
+
+    table = selectable_simple1.pristine
+    index = table.xy_index
+
+    copied = copy.deepcopy(table)
+    assert copied.xy_index is index
+    assert copied._signature == table._signature
+
+    copied.cells = copied.cells[:10]
+    assert len(copied.xy_index) == 10
+    assert table.xy_index is index
+
+
+def test_table_copied_column_by_column():
+    """
+    Test that a copied table has its own columns, but shares the
+    values held in them, and does not copy materialised cells.
+    """
+
+    table = Table()
+    table.append_row(0, ["foo", "bar"])
+    cells = table.cells
+
+    copied = copy.deepcopy(table)
+    assert copied._cells is None
+    assert copied._values is not table._values
+    assert copied._xs is not table._xs
+    assert copied._values[0] is table._values[0]
+
+    copied.set_values({0: "baz"})
+    assert copied.cells == [
+        Cell(x=0, y=0, value="baz"),
+        Cell(x=1, y=0, value="bar"),
+    ]
+    assert table.values == ["foo", "bar"]
+    assert table.cells is cells
+    assert cells[0].value == "foo"
+
+
+def test_table_add_cell_resets_xy_index():
+    """
+    Test that adding a cell to a table is reflected in its
+    coordinate index.
+    """
+
+    table = Table()
+    assert table.cell_at(0, 0) is None
+
+    table.add_cell(Cell(x=0, y=0, value="foo"))
+    assert table.cell_at(0, 0).value == "foo"
+
+
+def test_table_columns_materialise_cells():
+    """
+    Test that a table populated by co-ordinates and values
+    only materialises cell objects once they are asked for.
+    """
+
+    table = Table()
+    table.append(0, 0, "foo")
+    table.append(1, 0, "bar")
+    assert table._cells is None
+    assert len(table) == 2
+    assert list(table.xs) == [0, 1]
+    assert list(table.ys) == [0, 0]
+    assert table.values == ["foo", "bar"]
+    assert table.value_at(1) == "bar"
+
+    # Asking for some cells only creates those cells
+    assert table.cells_at([1]) == [Cell(x=1, y=0, value="bar")]
+    assert table.cell_at(0, 0) == Cell(x=0, y=0, value="foo")
+    assert table._cells is None
+
+    cells = table.cells
+    assert cells == [Cell(x=0, y=0, value="foo"), Cell(x=1, y=0, value="bar")]
+    assert table.cells is cells
+
+    table.append(0, 1, "baz")
+    assert table.cells[2] == Cell(x=0, y=1, value="baz")
+    assert table.cell_at(0, 1) == table.cells[2]
+    assert table.cell_at(0, 1) is not table.cells[2]
+
+
+def test_table_append_row():
+    """
+    Test that a row of values can be appended to a table in
+    one call, extending any codes or cells already derived.
+    """
+
+    table = Table()
+    table.append_row(0, ["foo", "bar"])
+    assert list(table.xs) == [0, 1]
+    assert list(table.ys) == [0, 0]
+    assert table.values == ["foo", "bar"]
+
+    table.codes
+    cells = table.cells
+    table.append_row(1, ["bar", "baz"], x=1)
+    assert table.cells is cells
+    assert table.cells[3] == Cell(x=2, y=1, value="baz")
+    assert list(table.codes) == [0, 1, 1, 2]
+    assert table.cell_at(1, 1).value == "bar"
+
+    sparse = SparseTable()
+    sparse.append_row(0, ["foo", "", "bar"])
+    sparse.append_row(1, ["", "baz"])
+    assert len(sparse) == 5
+    assert list(sparse._stored_positions) == [0, 2, 4]
+    assert sparse.cells[4] == Cell(x=1, y=1, value="baz")
+
+
+def test_table_columns_derived_from_cells():
+    """
+    Test that a table populated with a list of cells derives
+    its columns from those cells.
+    """
+
+    cells = [Cell(x=0, y=0, value="foo"), Cell(x=0, y=1, value="bar")]
+    table = Table(cells)
+    assert len(table) == 2
+    assert list(table.ys) == [0, 1]
+    assert table.values == ["foo", "bar"]
+
+    table.add_cell(Cell(x=0, y=2, value="baz"))
+    assert table.values == ["foo", "bar", "baz"]
+    assert table.cells[2].value == "baz"
+
+
+def test_livetable_selection_mask(selectable_simple1: Selectable):
+    """
+    Test that the current selection is tracked as a mask of
+    positions in the pristine table.
+    """
+
+    assert not selectable_simple1.selections_made()
+    assert selectable_simple1.positions == list(range(2600))
+
+    selection = selectable_simple1.excel_ref("B1")
+    assert selection.selections_made()
+    assert selection.positions == [1]
+    assert selection.mask == 0b10
+
+    filtered = selection.filtered
+    assert filtered.cells == selection.cells
+    assert filtered._signature == selection.signature
+
+    # A livetable can be created from any table taken from the pristine table
+    livetable = LiveTable(selection.pristine, filtered)
+    assert livetable.positions == [1]
+
+    # Even one holding as many cells as the pristine table
+    pristine = Table([Cell(x=0, y=0, value="a"), Cell(x=1, y=0, value="b")])
+    filtered = Table([Cell(x=0, y=0, value="a"), Cell(x=0, y=0, value="a")])
+    filtered._signature = pristine._signature
+    assert LiveTable(pristine, filtered).positions == [0]
+
+    # But not one holding cells the pristine table does not
+    with pytest.raises(CellsDoNotExistError):
+        selection.cells = [Cell(x=0, y=500, value="x")]
+    filtered = Table([Cell(x=5, y=0, value="c")])
+    filtered._signature = pristine._signature
+    with pytest.raises(CellsDoNotExistError):
+        LiveTable(pristine, filtered)
+
+
+def test_livetable_cells_are_its_own(selectable_simple1: Selectable):
+    """
+    Test that changing the cells of a selection changes neither the
+    pristine table nor the selections made from it.
+    """
+
+    # Materialise the cells of the pristine table
+    assert len(selectable_simple1.pcells) == 2600
+
+    selection = selectable_simple1.excel_ref("A1")
+    selection.cells[0].value = "ZZZ"
+
+    assert selectable_simple1.excel_ref("A1").lone_value() == "A1val"
+    assert selectable_simple1.pristine.cell_at(0, 0).value == "A1val"
+    assert len(selectable_simple1.is_exactly("A1val").cells) == 1
+    assert len(selectable_simple1.re("ZZZ").cells) == 0
+
+
+def test_sparse_table():
+    """
+    Test that a sparse table only stores cells with a value, while
+    positioning and answering for every cell.
+    """
+
+    table = SparseTable()
+    for y, row in enumerate([["foo", "", " "], [], ["", "bar"]]):
+        for x, value in enumerate(row):
+            table.append(x, y, value)
+
+    assert len(table) == 5
+    assert list(table._stored_positions) == [0, 2, 4]
+    assert table._stored_values == ["foo", " ", "bar"]
+    assert table.position_of(1, 2) == 4
+    assert table.position_of(2, 2) is None
+    assert table.position_of(0, 1) is None
+    assert table.position_of(0, 5) is None
+    assert table.value_at(3) == ""
+    assert table.cell_at(1, 0) == Cell(x=1, y=0, value="")
+    assert list(table.xs) == [0, 1, 2, 0, 1]
+    assert list(table.ys) == [0, 0, 0, 2, 2]
+
+    table.set_value(1, "baz")
+    assert table.cells[1].value == "baz"
+    table.set_value(1, "")
+    assert 1 not in table._stored_positions
+    assert table.values[1] == ""
+
+    # Values are merged into (and removed from) those stored
+    table.set_values({0: "", 1: "a", 3: "b", 4: "c"})
+    assert list(table._stored_positions) == [1, 2, 3, 4]
+    assert table._stored_values == ["a", " ", "b", "c"]
+
+    table.add_cell(Cell(x=2, y=2, value="qux"))
+    assert table.cell_at(2, 2).value == "qux"
+
+    with pytest.raises(UnorderedCellsError):
+        table.append(4, 2, "out of order")
+    with pytest.raises(UnorderedCellsError):
+        table.append(0, 1, "out of order")
+
+
+def test_sparse_table_value_indexes():
+    """
+    Test that a sparse table answers queries of its values from the
+    cells it stores, without holding a value for every cell.
+    """
+
+    table = SparseTable()
+    table.append_rows([["foo", "", " "], ["", "2", "foo"]])
+
+    assert {v: list(p) for v, p in table.value_index.items()} == {
+        "foo": [0, 5],
+        " ": [2],
+        "2": [4],
+    }
+    assert sorted(table.distinct_values) == ["", " ", "2", "foo"]
+    assert table.empty_mask() == 0b001010
+    assert table.value_mask(["", "2"]) == 0b011010
+    assert table.blank_mask() == 0b001110
+    assert table.blank_mask(disregard_whitespace=False) == 0b001010
+    assert table.pattern_mask("^f") == 0b100001
+    assert table.numeric_mask() == 0b010000
+    assert table._values is None
+
+    table.set_value(1, "bar")
+    assert table.blank_mask() == 0b001100
+    assert table.value_mask([""]) == 0b001000
+    assert table.values == ["foo", "bar", " ", "", "2", "foo"]
+
+    table = SparseTable()
+    table.append_row(0, ["a"])
+    assert list(table.distinct_values) == ["a"]
+
+
+def test_table_values_are_pooled():
+    """
+    Test that repeated values in a table are held once,
+    and that every value has a code.
+    """
+
+    table = Table()
+    for x, value in enumerate(["".join(["To", "tal"]), "foo", "".join(["Tot", "al"])]):
+        table.append(x, 0, value)
+
+    assert table.values[0] is table.values[2]
+    assert list(table.codes) == [0, 1, 0]
+    assert table.pool.code_of("Total") == 0
+
+    table.append(3, 0, "bar")
+    table.add_cell(Cell(x=4, y=0, value="".join(["f", "oo"])))
+    assert list(table.codes) == [0, 1, 0, 2, 1]
+    assert table.values[4] is table.values[1]
+
+    table.set_value(1, "".join(["b", "ar"]))
+    assert list(table.codes) == [0, 2, 0, 2, 1]
+    assert table.values[1] is table.values[3]
+
+    table = Table([Cell(x=0, y=0, value="foo"), Cell(x=1, y=0, value="foo")])
+    assert list(table.codes) == [0, 0]
+
+
+def test_sparse_table_values_are_pooled():
+    """
+    Test that the values stored by a sparse table are pooled.
+    """
+
+    table = SparseTable()
+    for x, value in enumerate(["".join(["To", "tal"]), "", "".join(["Tot", "al"])]):
+        table.append(x, 0, value)
+
+    assert table.value_at(0) is table.value_at(2)
+    assert list(table.codes) == [0, 1, 0]
+
+
+def test_table_row_and_column_indexes():
+    """
+    Test that a table can group the positions of its cells
+    by row and by column, in order.
+    """
+
+    table = Table(
+        [
+            Cell(x=1, y=1, value="d"),
+            Cell(x=0, y=0, value="a"),
+            Cell(x=1, y=0, value="b"),
+            Cell(x=0, y=1, value="c"),
+        ]
+    )
+
+    assert {y: (list(xs), list(ps)) for y, (xs, ps) in table.row_index.items()} == {
+        0: ([0, 1], [1, 2]),
+        1: ([0, 1], [3, 0]),
+    }
+    assert {x: (list(ys), list(ps)) for x, (ys, ps) in table.column_index.items()} == {
+        0: ([0, 1], [1, 3]),
+        1: ([0, 1], [2, 0]),
+    }
+
+    # Shared by copies, discarded when cells are added
+    assert copy.deepcopy(table).row_index is table.row_index
+    table.add_cell(Cell(x=2, y=0, value="e"))
+    assert list(table.row_index[0][0]) == [0, 1, 2]
+
+    # A sparse table works its indexes out from the extent of each row
+    sparse = SparseTable()
+    sparse.append_row(0, ["a", "", "b"], x=1)
+    sparse.append_row(2, ["c", "d"])
+    assert {x: (list(ys), list(ps)) for x, (ys, ps) in sparse.column_index.items()} == {
+        0: ([2], [3]),
+        1: ([0, 2], [0, 4]),
+        2: ([0], [1]),
+        3: ([0], [2]),
+    }
+    assert sparse._xs is None
+
+
+def test_table_positions_within():
+    """
+    Test that a table can return the positions of the cells
+    within a rectangle of x and y indicies.
+    """
+
+    table = Table()
+    for y in range(3):
+        for x in range(3):
+            table.append(x, y, f"{x}{y}")
+
+    assert sorted(table.positions_within(1, 2, 0, 1)) == [1, 2, 4, 5]
+    assert table.positions_within(0, 0, 2, 2) == [6]
+    assert table.positions_within(5, 6, 0, 2) == []
+
+    # A rectangle with more rows than the table
+    assert table.positions_within(1, 1, 0, 1000) == [1, 4, 7]
+
+
+def test_table_pattern_masks():
+    """
+    Test that a table holds a bounded number of pattern masks, and
+    that values that are not strings never match.
+    """
+
+    table = Table([Cell(x=0, y=0, value="2022"), Cell(x=1, y=0, value=None)])
+    table._pattern_mask_limit = 2
+
+    assert table.pattern_mask(".*") == 0b01
+    table.pattern_mask("^2")
+    table.pattern_mask(".*")
+    table.pattern_mask("^3")
+    assert list(table._pattern_masks) == [".*", "^3"]
+
+    table.append(0, 1, "2023")
+    assert table.pattern_mask("^2") == 0b101
+
+
+def test_table_value_index():
+    """
+    Test that a table can index the positions of its cells by
+    value, and that the index is discarded when values change.
+    """
+
+    table = Table()
+    for x, value in enumerate(["a", "b", "a", ""]):
+        table.append(x, 0, value)
+
+    assert {v: list(ps) for v, ps in table.value_index.items()} == {
+        "a": [0, 2],
+        "b": [1],
+        "": [3],
+    }
+    assert table.value_mask(["a", "z"]) == 0b0101
+
+    table.set_value(1, "a")
+    assert list(table.value_index["a"]) == [0, 1, 2]
+
+
+def test_table_substring_and_pattern_masks_with_ngram_index():
+    """
+    Test that substring and pattern masks are the same whether or
+    not the table uses an n-gram index to narrow its candidates.
+    """
+
+    table = Table()
+    for x, value in enumerate(["Total sales", "sales", "Subtotal", "", "tot"]):
+        table.append(x, 0, value)
+
+    unindexed = [
+        table.substring_mask("tal"),
+        table.substring_mask("ta"),
+        table.pattern_mask("^Sub.*tal$"),
+    ]
+    assert unindexed == [0b00101, 0b00101, 0b00100]
+    assert table._ngram_index is None
+
+    table.use_ngram_index = True
+    table._clear_value_indexes()
+    assert table.ngram_index["tal"] == {"Total sales", "Subtotal"}
+    assert [
+        table.substring_mask("tal"),
+        table.substring_mask("ta"),
+        table.pattern_mask("^Sub.*tal$"),
+    ] == unindexed
+    assert table.substring_mask("nope") == 0
+
+
+def test_table_numeric_column_and_masks():
+    """
+    Test that a table holds the values of its cells as numbers and
+    can filter by them, and that these are discarded when values change.
+    """
+
+    table = Table()
+    for x, value in enumerate(["Total", "3", "-1.5", "3", "", "10.0"]):
+        table.append(x, 0, value)
+
+    assert [n for n in table.numbers if not math.isnan(n)] == [3, -1.5, 3, 10]
+    assert list(table.numeric_order[1]) == [2, 1, 3, 5]
+
+    assert table.numeric_mask() == 0b101110
+    assert table.numeric_mask(minimum=3) == 0b101010
+    assert table.numeric_mask(minimum=3, inclusive=False) == 0b100000
+    assert table.numeric_mask(-2, 3, inclusive=False) == 0b000100
+    assert table.integer_mask() == 0b101010
+
+    table.set_value(0, "7")
+    assert table.numeric_mask(minimum=5) == 0b100001
+
+
+def test_table_blank_masks_kept_up_to_date():
+    """
+    Test that a table holds masks of its blank cells, and that
+    setting values updates rather than discards them.
+    """
+
+    for table in [Table(), SparseTable()]:
+        for x, value in enumerate(["a", "", "  ", "b"]):
+            table.append(x, 0, value)
+
+        assert table.blank_mask() == 0b0110
+        assert table.blank_mask(disregard_whitespace=False) == 0b0010
+
+        table.set_values({0: " ", 1: "c"})
+        masks = dict(table._blank_masks)
+        assert masks == {True: 0b0101, False: 0b0000}
+
+        # As they would be if computed afresh
+        table._clear_value_indexes()
+        assert table.blank_mask() == masks[True]
+        assert table.blank_mask(disregard_whitespace=False) == masks[False]
+
+
+def test_table_orderings(selectable_simple1: Selectable):
+    """
+    Test that a table knows whether its cells are held in row major
+    order and can order its cells, or a selection of them, by rows
+    or by columns, as the datafuncs orderings would.
+    """
+
+    assert selectable_simple1.pristine.row_major
+    selection = selectable_simple1.excel_ref("B2:D4") | selectable_simple1.excel_ref(
+        "A7"
+    )
+
+    cells = selection.cells
+    for ordered, expected in [
+        (selection.ordered_cells(), dfc.order_cells_leftright_topbottom(cells)),
+        (
+            selection.ordered_cells(reverse=True),
+            dfc.order_cells_rightleft_bottomtop(cells),
+        ),
+        (
+            selection.ordered_cells(by_columns=True),
+            dfc.order_cells_topbottom_leftright(cells),
+        ),
+        (
+            selection.ordered_cells(by_columns=True, reverse=True),
+            dfc.order_cells_bottomtop_rightleft(cells),
+        ),
+    ]:
+        assert ordered == expected
+
+    # A table built from unordered cells
+    table = Table(
+        [
+            Cell(x=1, y=1, value="d"),
+            Cell(x=0, y=0, value="a"),
+            Cell(x=1, y=0, value="b"),
+            Cell(x=0, y=1, value="c"),
+        ]
+    )
+    assert not table.row_major
+    assert [c.value for c in table.ordered_cells()] == ["a", "b", "c", "d"]
+    assert [c.value for c in table.ordered_cells(by_columns=True)] == [
+        "a",
+        "c",
+        "b",
+        "d",
+    ]
+    assert table.ordered_positions([0, 3], reverse=True) == [0, 3]
+    assert copy.deepcopy(table)._row_order is table._row_order
+
+    sparse = SparseTable()
+    sparse.append(0, 0, "a")
+    assert sparse.row_major
+
+
+def test_mapped_table():
+    """
+    Test that a mapped table decodes rows of the csv only as the
+    values on them are asked for, and keeps the values set on it
+    apart from the file.
+    """
+
+    table = MappedTable(path_to_fixture("csv", "quoted.csv"))
+    assert len(table) == 12
+    assert table._rows == {}
+    assert table.position_of(1, 3) == 7
+
+    cell = table.cell_at(1, 3)
+    assert cell == Cell(x=1, y=3, value="Formed in London,\nEngland")
+    assert list(table._rows) == [3]
+
+    table.set_value(7, "")
+    assert table.value_at(7) == ""
+    assert table.cell_at(1, 3).value == ""
+    assert table.cells[7].value == ""
+
+    copied = copy.deepcopy(table)
+    copied.set_value(0, "Name")
+    assert copied.cell_at(0, 0).value == "Name"
+    assert table.cell_at(0, 0).value == "Band"
+
+    with pytest.raises(ReadOnlyTableError):
+        table.append_row(5, ["foo"])
+
+    empty = MappedTable(path_to_fixture("csv", "empty.csv"))
+    assert len(empty) == 0
+    assert empty.cells == []
+
+
+def test_table_blank_masks_with_values_that_are_not_str():
+    """
+    Test that a value that is neither a str nor a nan/None value is
+    left out of the blank masks, and held in the invalid mask instead.
+    """
+
+    table = Table()
+    for x, value in enumerate(["a", "", 3, None]):
+        table.append(x, 0, value)
+
+    assert table.blank_mask() == 0b1010
+    assert table.invalid_mask() == 0b0100
+
+    table.set_values({0: 4, 2: ""})
+    assert table.blank_mask() == 0b1110
+    assert table.invalid_mask() == 0b0001
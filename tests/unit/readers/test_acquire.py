@@ -1,4 +1,6 @@
 from datachef import acquire
+from datachef.readers.objects.list import ListReader
+from datachef.readers.predicates import first_cell_matches, is_blank_row
 from datachef.selection.selectable import Selectable
 from tests.fixtures import path_to_fixture
 
@@ -13,3 +15,42 @@ def test_acquire_local():
 
     csv_path_as_str = csv_path.resolve()
     assert isinstance(acquire(csv_path_as_str), Selectable)
+
+
+def test_acquire_region():
+    """
+    Test that acquire can be limited to a region of the source,
+    the cells within it keeping their co-ordinates.
+    """
+
+    rows = [["a", "b", "c"], ["d", "e", "f"], ["g", "h", "i"], ["j", "k", "l"]]
+    table = acquire(rows, region="B2:C3")
+
+    assert [(c.x, c.y, c.value) for c in table.cells] == [
+        (1, 1, "e"),
+        (2, 1, "f"),
+        (1, 2, "h"),
+        (2, 2, "i"),
+    ]
+    assert table.excel_ref("C3").lone_value() == "i"
+
+    # No row after the region is read
+    rows = iter(rows)
+    ListReader(rows).parse(region="1:2")
+    assert next(rows) == ["g", "h", "i"]
+
+
+def test_acquire_skipping_rows():
+    """
+    Test that acquire can skip rows of the source, including rows
+    holding values that are not str.
+    """
+
+    rows = [[1, 2], ["Note", ""], ["", None], [0, ""]]
+    table = acquire(rows, skip_rows=[is_blank_row, first_cell_matches("^N")])
+    assert [(c.x, c.y, c.value) for c in table.cells] == [
+        (0, 0, 1),
+        (1, 0, 2),
+        (0, 3, 0),
+        (1, 3, ""),
+    ]
@@ -1,8 +1,15 @@
 from pathlib import Path
 
+import pytest
+
+from datachef.cardinal.directions import down, right
+from datachef.exceptions import IncompatibleReadOptionsError, InvalidTableSignatures
 from datachef.models.source.input import BaseInput
+from datachef.models.source.table import LiveTable, MappedTable, SparseTable
 from datachef.readers import reader
 from datachef.readers.base import BaseReader
+from datachef.readers.csv.local import LocalCsvReader, _parse_chunk
+from datachef.readers.predicates import first_cell_matches, is_blank_row
 from tests.fixtures import path_to_fixture
 
 
@@ -43,3 +50,246 @@ def test_reader_can_be_overwritten():
         str(csv_path.absolute()), override_reader=FakeReader
     )
     assert str_instead_of_selectable == "foo"
+
+
+def test_read_local_csv_holds_a_single_table():
+    """
+    Test that reading a csv holds the parsed table once, with
+    the initial selection being every cell of that table rather
+    than a copy of it.
+    """
+    csv_path: Path = path_to_fixture("csv", "simple.csv")
+    sheet: BaseInput = reader.read_local(csv_path)
+
+    assert not sheet.selections_made()
+    assert sheet.pristine._cells is None  # nothing materialised
+
+
+def test_read_local_csv_still_validates_signatures():
+    """
+    Test that a livetable created from another table taken from the
+    same parsed source still has its signatures confirmed.
+    """
+    csv_path: Path = path_to_fixture("csv", "simple.csv")
+    sheet1: BaseInput = reader.read_local(csv_path)
+    sheet2: BaseInput = reader.read_local(csv_path)
+
+    with pytest.raises(InvalidTableSignatures):
+        LiveTable(sheet1.pristine, sheet2.pristine)
+
+
+def test_read_local_csv_sparse():
+    """
+    Test that reading a csv sparsely gives the same cells
+    as reading it in full, while only storing the cells
+    that hold a value.
+    """
+
+    for fixture in ["bands.csv", "has_blanks.csv", "simple.csv"]:
+        csv_path: Path = path_to_fixture("csv", fixture)
+        dense: BaseInput = reader.read_local(csv_path)
+        sparse: BaseInput = reader.read_local(csv_path, sparse=True)
+
+        assert isinstance(sparse.pristine, SparseTable)
+        assert sparse.cells == dense.cells
+        assert len(sparse.pristine._stored_positions) == len(
+            [c for c in dense.cells if c.value != ""]
+        )
+
+
+def test_read_local_csv_buffer_size():
+    """
+    Test that the size of the buffer a csv is streamed through
+    has no bearing on the cells read.
+    """
+
+    csv_path: Path = path_to_fixture("csv", "bands.csv")
+    sheet: BaseInput = reader.read_local(csv_path)
+    buffered: BaseInput = reader.read_local(csv_path, buffer_size=16)
+    assert buffered.cells == sheet.cells
+
+
+def test_read_local_csv_in_parallel():
+    """
+    Test that reading a csv in chunks across a pool of processes
+    gives exactly the table read serially.
+    """
+
+    for fixture in ["bands.csv", "empty.csv", "quoted.csv", "simple.csv"]:
+        csv_path: Path = path_to_fixture("csv", fixture)
+        serial: BaseInput = reader.read_local(csv_path)
+        parallel: BaseInput = reader.read_local(csv_path, workers=3)
+
+        assert list(parallel.pristine.xs) == list(serial.pristine.xs)
+        assert list(parallel.pristine.ys) == list(serial.pristine.ys)
+        assert parallel.pristine.values == serial.pristine.values
+
+    # Quotes outside of quoted fields mislead the chunking, so some
+    # chunks begin within a field and the file is read serially from
+    # the first chunk that does not end at the end of a row
+    csv_path: Path = path_to_fixture("csv", "stray_quotes.csv")
+    serial: BaseInput = reader.read_local(csv_path)
+    for workers in range(2, 9):
+        parallel: BaseInput = reader.read_local(csv_path, workers=workers)
+        assert list(parallel.pristine.ys) == list(serial.pristine.ys)
+        assert parallel.pristine.values == serial.pristine.values
+
+
+def test_read_local_csv_in_many_chunks():
+    """
+    Test that a csv split into many more chunks than there are
+    processes, of which only a few are parsed at a time, is read
+    as it would be serially.
+    """
+
+    for fixture in ["quoted.csv", "simple.csv", "stray_quotes.csv"]:
+        csv_path: Path = path_to_fixture("csv", fixture)
+        serial: BaseInput = reader.read_local(csv_path)
+
+        rows = list(LocalCsvReader(csv_path)._parse_in_parallel(",", 2, 16))
+        assert [v for row in rows for v in row] == serial.pristine.values
+
+
+def test_parse_csv_chunk():
+    """
+    Test that a chunk of a csv is parsed as it would be were the
+    whole file read.
+    """
+
+    csv_path: Path = path_to_fixture("csv", "quoted.csv")
+    rows = _parse_chunk(csv_path, 52, 92, ",")
+    assert rows == [[], ["Queen", "Formed in London,\nEngland", "1970"]]
+
+    # A chunk that ends within a quoted field is refused
+    csv_path: Path = path_to_fixture("csv", "stray_quotes.csv")
+    assert _parse_chunk(csv_path, 0, 73, ",") is None
+    assert _parse_chunk(csv_path, 0, 51, ",")[1] == [
+        'O"Brien',
+        'Said "hi"\ntwice',
+        '5"11',
+    ]
+
+
+def test_read_local_csv_region():
+    """
+    Test that reading a region of a csv gives just the cells of
+    that region, at their co-ordinates in the file.
+    """
+
+    csv_path: Path = path_to_fixture("csv", "simple.csv")
+    sheet: BaseInput = reader.read_local(csv_path)
+
+    for region, excel_ref, cell_count in [
+        ("B2:D10", "B2:D10", 27),
+        ("C:D", "C1:D100", 200),
+        ("3:4", "A3:Z4", 52),
+    ]:
+        for read in [
+            reader.read_local(csv_path, region=region),
+            reader.read_local(csv_path, region=region, sparse=True),
+            reader.read_local(csv_path, region=region, workers=2),
+        ]:
+            assert len(read.pristine) == cell_count
+            assert read.cells == sheet.excel_ref(excel_ref).cells
+            assert read.excel_ref(excel_ref).cells == read.cells
+
+    with pytest.raises(IncompatibleReadOptionsError):
+        reader.read_local(csv_path, region="B2:D10", mapped=True)
+
+
+def test_read_local_csv_skipping_rows():
+    """
+    Test that rows of a csv can be skipped as it is read, the
+    cells that follow keeping their co-ordinates in the file.
+    """
+
+    csv_path: Path = path_to_fixture("csv", "quoted.csv")
+    skip_rows = [is_blank_row, first_cell_matches("^Q")]
+
+    for read in [
+        reader.read_local(csv_path, skip_rows=skip_rows),
+        reader.read_local(csv_path, skip_rows=skip_rows, sparse=True),
+        reader.read_local(csv_path, skip_rows=skip_rows, workers=2),
+    ]:
+        assert len(read.pristine) == 9
+        assert read.excel_ref("A5").lone_value() == "Pink Floyd"
+        assert [c.y for c in read.excel_ref("A").cells] == [0, 1, 4]
+
+    read = reader.read_local(csv_path, skip_rows=skip_rows, region="B2:C5")
+    assert [(c.x, c.y) for c in read.cells] == [(1, 1), (2, 1), (1, 4), (2, 4)]
+
+    with pytest.raises(IncompatibleReadOptionsError):
+        reader.read_local(csv_path, skip_rows=skip_rows, mapped=True)
+
+
+def test_sparse_csv_selections():
+    """
+    Test that selections that consider or write to the blank cells
+    of a table behave the same for a sparsely read csv.
+    """
+
+    csv_path: Path = path_to_fixture("csv", "bands.csv")
+    for sheet in [
+        reader.read_local(csv_path),
+        reader.read_local(csv_path, sparse=True),
+    ]:
+        assert len(sheet.is_blank().cells) == 28
+        assert len(sheet.is_blank(disregard_whitespace=False).cells) == 28
+        assert len(sheet.excel_ref("C2").expand(down).cells) == 12
+        assert len(sheet.excel_ref("C2").fill(down).is_not_blank().cells) == 8
+
+        spread = sheet.excel_ref("A3").spread(down)
+        assert spread.excel_ref("A4").lone_value() == "Beatles"
+        assert sheet.excel_ref("A4").lone_value() == ""
+
+
+def test_read_local_csv_mapped():
+    """
+    Test that reading a csv via a memory map gives the same
+    cells as reading it, decoding only the rows selected.
+    """
+
+    for fixture in [
+        "bands.csv",
+        "has_blanks.csv",
+        "quoted.csv",
+        "simple.csv",
+        "stray_quotes.csv",
+    ]:
+        csv_path: Path = path_to_fixture("csv", fixture)
+        read: BaseInput = reader.read_local(csv_path)
+        mapped: BaseInput = reader.read_local(csv_path, mapped=True)
+
+        assert isinstance(mapped.pristine, MappedTable)
+        assert len(mapped.pristine) == len(read.pristine)
+        assert mapped.excel_ref("A2").cells == read.excel_ref("A2").cells
+        assert mapped.cells == read.cells
+
+    mapped: BaseInput = reader.read_local(
+        path_to_fixture("csv", "simple.csv"), mapped=True
+    )
+    assert len(mapped.excel_ref("B2:D10").cells) == 27
+    assert len(mapped.excel_ref("A5").expand(right).cells) == 26
+    assert sorted(mapped.pristine._rows) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_mapped_csv_selections():
+    """
+    Test that selections that consider or write to the cells
+    of a table behave the same for a memory mapped csv.
+    """
+
+    csv_path: Path = path_to_fixture("csv", "quoted.csv")
+    for sheet in [
+        reader.read_local(csv_path),
+        reader.read_local(csv_path, mapped=True),
+    ]:
+        assert sheet.excel_ref("B4").lone_value() == "Formed in London,\nEngland"
+        assert sheet.excel_ref("B2").lone_value() == 'The "Fab" Four'
+        assert len(sheet.is_blank().cells) == 1
+        assert len(sheet.excel_ref("C").is_numeric().cells) == 3
+
+        spread = sheet.excel_ref("B4").spread(down)
+        assert spread.excel_ref("B5").lone_value() == "Formed in London,\nEngland"
+        assert sheet.excel_ref("B5").lone_value() == ""
+        assert "" not in spread.pristine.distinct_values
@@ -0,0 +1,28 @@
+from datachef.readers.predicates import first_cell_matches, is_blank_row
+
+
+def test_is_blank_row():
+    """
+    Test that the blank row predicate holds for rows where
+    every field is blank.
+    """
+
+    assert is_blank_row([])
+    assert is_blank_row(["", " "])
+    assert not is_blank_row(["", "foo"])
+    assert not type(is_blank_row)(disregard_whitespace=False)(["", " "])
+    assert is_blank_row([None, ""])
+    assert not is_blank_row([0, ""])
+
+
+def test_first_cell_matches():
+    """
+    Test that the first cell matches predicate holds for rows
+    whose first field matches the provided pattern.
+    """
+
+    is_note = first_cell_matches("^Note")
+    assert is_note(["Note: provisional", "1"])
+    assert not is_note(["1", "Note: provisional"])
+    assert not is_note([])
+    assert not is_note([1, "Note: provisional"])
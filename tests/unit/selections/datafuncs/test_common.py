@@ -3,8 +3,8 @@ from typing import List
 
 import pytest
 
-from datachef.exceptions import CellsDoNotExistError
-from datachef.models.source.cell import BaseCell, Cell
+from datachef.exceptions import CellsDoNotExistError, NonExistentCellComparissonError
+from datachef.models.source.cell import BaseCell, Cell, VirtualCell
 from datachef.selection import datafuncs as dfc
 from datachef.selection.selectable import Selectable
 from tests.fixtures import fixture_simple_one_tab
@@ -337,3 +337,57 @@ def test_all_used_y_indicies(selectable_simple1: Selectable):
     s = selectable_simple1.excel_ref("D5:F15")
     x_indicies: List[int] = dfc.all_used_y_indicies(s.cells)
     assert set(x_indicies) == {4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14}
+
+
+def test_xy_coordinates(selectable_simple1: Selectable):
+    """
+    Confirm we can get the set of x and y co-ordinates occupied
+    by a list of cells.
+    """
+
+    s = selectable_simple1.excel_ref("B2:C3")
+    assert dfc.xy_coordinates(s.cells) == {(1, 1), (2, 1), (1, 2), (2, 2)}
+
+
+def test_positional_extents(selectable_simple1: Selectable):
+    """
+    Confirm we can get the lowest and highest offset in use
+    on each line of a selection.
+    """
+
+    s = selectable_simple1.excel_ref("B2:C4") | selectable_simple1.excel_ref("E9")
+    xs = s.pristine.xs
+    ys = s.pristine.ys
+
+    assert dfc.positional_extents(s.positions, xs, ys) == {
+        1: (1, 3),
+        2: (1, 3),
+        4: (8, 8),
+    }
+    assert dfc.positional_extents(s.positions, ys, xs) == {
+        1: (1, 2),
+        2: (1, 2),
+        3: (1, 2),
+        8: (4, 4),
+    }
+
+    # Positions need not be ordered
+    assert dfc.positional_extents([0, 2, 1], [0, 0, 0], [5, 3, 1]) == {0: (1, 5)}
+
+
+def test_positional_datafuncs_reject_virtual_cells(selectable_simple1: Selectable):
+    """
+    Test that comparing a virtual cell by position with the cells
+    of a selection raises.
+    """
+
+    virtual = VirtualCell(value="x")
+    cells: List[Cell] = selectable_simple1.excel_ref("A1:B2").cells
+
+    with pytest.raises(NonExistentCellComparissonError):
+        dfc.cells_not_in([virtual], cells)
+    with pytest.raises(NonExistentCellComparissonError):
+        dfc.matching_xy_cells([virtual], cells)
+
+    # As nothing is compared, nothing raises
+    assert dfc.cells_not_in([virtual], []) == [virtual]
@@ -100,6 +100,35 @@ def test_any_excel_ref_as_wanted_basecells():
         dfc.any_excel_ref_as_wanted_basecells("C5:A1")
 
 
+def test_multi_excel_ref_to_bounds():
+    """
+    Test that we can convert a multiple cell excel reference into
+    the bounds of the rectangle of cells it refers to.
+    """
+    assert dfc.multi_excel_ref_to_bounds("B3:D10") == (1, 3, 2, 9)
+
+    with pytest.raises(ReversedExcelRefError):
+        dfc.multi_excel_ref_to_bounds("C5:A1")
+
+
+def test_excel_region_to_bounds():
+    """
+    Test that we can convert an excel reference to a region of
+    cells, rows or columns into the bounds of that region.
+    """
+    assert dfc.excel_region_to_bounds("B3:D10") == (1, 3, 2, 9)
+    assert dfc.excel_region_to_bounds("B:D") == (1, 3, 0, None)
+    assert dfc.excel_region_to_bounds("3:10") == (0, None, 2, 9)
+
+    for reversed_ref in ["C5:A1", "D:B", "10:3"]:
+        with pytest.raises(ReversedExcelRefError):
+            dfc.excel_region_to_bounds(reversed_ref)
+
+    for bad_ref in ["B3", "B:3", "foo"]:
+        with pytest.raises(BadExcelReferenceError):
+            dfc.excel_region_to_bounds(bad_ref)
+
+
 def test_single_excel_row_to_y_index(selectable_simple1: Selectable):
     """
     Confirm that passing in an excel reference consisting of a single
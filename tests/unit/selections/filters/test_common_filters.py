@@ -52,3 +52,16 @@ def test_filter_is_not_numeric(selectable_vertical_dimensions: Selectable):
     )
     assert len(s.cells) == 2
     assert dfc.basecells_to_excel_ref(s.cells) == "D12:E12"
+
+
+def test_filter_contains_string_with_ngram_index(selectable_simple1: Selectable):
+    """
+    Test the contains_string filter gives the same selection when
+    the source table is indexed by n-gram.
+    """
+
+    s = selectable_simple1.index_ngrams().excel_ref("A1:G25")
+    assert s.pristine.use_ngram_index
+    assert len(s.filter(filters.contains_string("A1")).cells) == 11
+    assert len(s.filter(filters.contains_string("A12")).cells) == 1
+    assert filters.contains_string("A12")(s.excel_ref("A12").cells[0])
@@ -1,5 +1,7 @@
 import pytest
 
+from datachef import acquire
+from datachef.exceptions import InvalidCellObjectError
 from datachef.selection.selectable import Selectable
 from tests.fixtures import fixture_with_blanks
 
@@ -35,3 +37,18 @@ def test_all_non_blanks_from_table(table_with_blanks: Selectable):
     """
     table_without_blanks = table_with_blanks.is_not_blank()
     assert len(table_without_blanks.cells) == 3
+
+
+def test_blanks_with_values_that_are_not_str():
+    """
+    Test that a value that is not a str only raises where the
+    cell holding it is one of those checked for being blank.
+    """
+    table = acquire([["", 2], ["a", ""]])
+
+    assert len(table.excel_ref("A").is_blank().cells) == 1
+    assert len(table.excel_ref("A").is_not_blank().cells) == 1
+
+    for check in [table.is_blank, table.excel_ref("B").is_not_blank]:
+        with pytest.raises(InvalidCellObjectError):
+            check()
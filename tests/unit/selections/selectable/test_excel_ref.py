@@ -45,6 +45,27 @@ def test_excel_referece_out_of_bounds_error(
         selectable_simple1.excel_ref("AA2")
 
 
+def test_excel_reference_ranges_within_selection(
+    selectable_simple1: Selectable,
+):
+    """
+    Test that range references select only from the current selection
+    and raise, naming the missing cells, where any are not within it.
+    """
+
+    s = selectable_simple1.excel_ref("A1:C3")
+    assert len(s.cells) == 9
+    assert len(s.excel_ref("B2:C3").cells) == 4
+    assert len(s.excel_ref("2").cells) == 3
+    assert len(s.excel_ref("C").cells) == 3
+    assert len(s.excel_ref("D").cells) == 0
+
+    with pytest.raises(CellsDoNotExistError) as exc_info:
+        s.excel_ref("C3:D3")
+    assert "x=3, y=2" in str(exc_info.value)
+    assert "x=2, y=2" not in str(exc_info.value)
+
+
 def test_excel_referece_bad_reference_error(
     selectable_simple1: Selectable,
 ):
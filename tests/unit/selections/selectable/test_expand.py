@@ -1,5 +1,6 @@
 import pytest
 
+from datachef import acquire
 from datachef.cardinal.directions import down, left, right, up
 from datachef.exceptions import CellsDoNotExistError
 from datachef.selection.selectable import Selectable
@@ -39,3 +40,28 @@ def test_out_of_bounds_from_excel_ref(selectable_simple1: Selectable):
 
     with pytest.raises(CellsDoNotExistError):
         selectable_simple1.excel_ref("ADFG120909")
+
+
+def test_expand_ragged_and_unselected():
+    """
+    Test that expanding considers only the cells that exist on each
+    row or column, and that a selection from the middle of a line
+    expands from its outermost cell.
+    """
+
+    s: Selectable = acquire(
+        [
+            ["a", "b", "c", "d"],
+            ["e", "f"],
+            ["g", "h", "i"],
+        ]
+    )
+
+    assert len(s.excel_ref("C1").expand(down).cells) == 2
+    assert len(s.excel_ref("A2").expand(right).cells) == 2
+    assert len(s.excel_ref("B3").expand(up).cells) == 3
+    assert len((s.excel_ref("B1") | s.excel_ref("B3")).expand(up).cells) == 2
+    assert len((s.excel_ref("B1") | s.excel_ref("D1")).expand(left).cells) == 3
+
+    # Directions with an offset do not expand
+    assert len(s.excel_ref("A1").expand(down(2)).cells) == 1
@@ -1,6 +1,8 @@
 import pytest
 
+from datachef import acquire
 from datachef.cardinal.directions import down, left, right, up
+from datachef.selection import datafuncs as dfc
 from datachef.selection.selectable import Selectable
 from tests.fixtures import fixture_simple_one_tab
 
@@ -30,3 +32,21 @@ def test_expand(selectable_simple1: Selectable):
         "Z4"
     ).fill(left)
     assert len(s.cells) == 0
+
+
+def test_fill_is_positional():
+    """
+    Test that fill excludes the cells we started with by position
+    alone, so cells holding the same values are still selected.
+    """
+
+    s: Selectable = acquire(
+        [
+            ["foo", "foo", "foo"],
+            ["foo", "foo", "foo"],
+        ]
+    )
+
+    filled = s.excel_ref("A1:A2").fill(right)
+    assert len(filled.cells) == 4
+    assert dfc.basecells_to_excel_ref(filled.cells) == "B1:C2"
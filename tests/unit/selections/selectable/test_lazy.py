@@ -0,0 +1,95 @@
+import pytest
+
+from datachef import acquire
+from datachef.cardinal.directions import down, right
+from datachef.exceptions import CellsDoNotExistError
+from datachef.selection import datafuncs as dfc
+from datachef.selection import filters
+from datachef.selection.selectable import Selectable
+from tests.fixtures import fixture_simple_one_tab
+
+
+@pytest.fixture
+def selectable_simple1():
+    return fixture_simple_one_tab()
+
+
+def test_lazy_selection_matches_eager(selectable_simple1: Selectable):
+    """
+    Test that a chain of calls on a lazy selection is deferred until
+    the cells are needed and then gives the same selection as the
+    same chain run eagerly.
+    """
+
+    def chain(s: Selectable) -> Selectable:
+        header = s.excel_ref("B2:D2")
+        return (
+            header.fill(down) | s.excel_ref("A5").expand(right)
+        ).is_not_blank().filter(lambda c: not c.value.endswith("0")).re(
+            "^[BCD]"
+        ).filter(
+            filters.contains_string("1")
+        ).shift(
+            0, 1
+        ) - s.excel_ref(
+            "C"
+        )
+
+    eager = chain(selectable_simple1)
+    lazy = chain(selectable_simple1.lazy())
+
+    assert lazy._pending
+    assert lazy.cells == eager.cells
+    assert not lazy._pending
+
+    # Opting back out of lazy mode runs calls as made
+    assert not lazy.lazy(False).is_blank()._pending
+
+
+def test_lazy_selection_fuses_and_reorders_checks(selectable_simple1: Selectable):
+    """
+    Test that cell by cell checks of a lazy selection are run after
+    the checks that filter a whole table at once, and that consecutive
+    cell by cell checks are made in a single pass over the cells.
+    """
+    seen = []
+
+    def check(cell):
+        seen.append(cell)
+        return cell.value.startswith("A")
+
+    s = (
+        selectable_simple1.lazy()
+        .excel_ref("A1:C10")
+        .filter(check)
+        .filter(lambda c: c.y < 5)
+        .re("^.1val$")
+    )
+    assert [c.value for c in s.cells] == ["A1val"]
+
+    # Only A1, B1 and C1 survived the regex to be checked
+    assert len(seen) == 3
+
+
+def test_lazy_selection_keeps_barriers_in_order(selectable_simple1: Selectable):
+    """
+    Test that operations that do not simply narrow a selection
+    are not reordered, so raise as they would if run eagerly.
+    """
+    s = selectable_simple1.lazy().re("^A").excel_ref("B1")
+    with pytest.raises(CellsDoNotExistError):
+        s.cells
+
+
+def test_lazy_selection_keeps_blank_checks_in_order():
+    """
+    Test that the blank checks, which raise depending upon the rest
+    of the selection, are not moved ahead of cell by cell checks.
+    """
+
+    def chain(s: Selectable) -> Selectable:
+        return s.filter(lambda c: isinstance(c.value, str)).is_blank()
+
+    s = acquire([["a", 5], ["", "x"]])
+    assert dfc.basecells_to_excel_ref(chain(s).cells) == "A2:A2"
+    assert dfc.basecells_to_excel_ref(chain(s.lazy()).cells) == "A2:A2"
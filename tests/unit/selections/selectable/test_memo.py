@@ -0,0 +1,149 @@
+import weakref
+from dataclasses import dataclass
+
+import pytest
+
+from datachef import acquire
+from datachef.cardinal.directions import down
+from datachef.models.source.expression import SelectionMemo
+from datachef.selection import filters
+from datachef.selection.selectable import Selectable
+from tests.fixtures import fixture_simple_one_tab
+
+
+@pytest.fixture
+def selectable_simple1():
+    return fixture_simple_one_tab()
+
+
+# The cells passed to EndsWith checks
+calls = []
+
+
+@dataclass
+class EndsWith:
+    suffix: str
+
+    def __call__(self, cell):
+        calls.append(cell)
+        return cell.value.endswith(self.suffix)
+
+
+@pytest.fixture
+def counted_check():
+    calls.clear()
+    return EndsWith("1val"), calls
+
+
+def test_repeated_selections_are_memoised(
+    selectable_simple1: Selectable, counted_check
+):
+    """
+    Test that making the same chain of selections from the same source
+    table a second time takes the result from the memo.
+    """
+    check, calls = counted_check
+
+    first = selectable_simple1.excel_ref("A").filter(check)
+    assert len(calls) == 100
+    second = selectable_simple1.excel_ref("A").filter(check)
+    assert len(calls) == 100
+    assert second.cells == first.cells
+
+    # As do lazy selections, and the two agree
+    lazy = selectable_simple1.lazy().excel_ref("A").filter(check)
+    assert lazy.cells == first.cells
+    assert len(calls) == 100
+
+    # A different chain is worked out
+    selectable_simple1.excel_ref("B").filter(check)
+    assert len(calls) == 200
+
+
+def test_memoised_selections_depend_on_arguments(selectable_simple1: Selectable):
+    """
+    Test that selections made with differing arguments, including
+    other selections, are not confused with one another.
+    """
+    s = selectable_simple1
+    assert s.excel_ref("A1").lone_value() == "A1val"
+    assert s.excel_ref("A2").lone_value() == "A2val"
+    assert len(s.filter(filters.contains_string("A1")).cells) == 12
+    assert len(s.filter(filters.contains_string("A2")).cells) == 11
+
+    a = s.excel_ref("A1").expand(down)
+    assert len((a - s.excel_ref("A1:A5")).cells) == 95
+    assert len((a - s.excel_ref("A1:A6")).cells) == 94
+
+    # Nor are the results of checks that are not dataclasses, what
+    # they select can change between calls
+    labels = {"A1val"}
+    in_labels = lambda cell: cell.value in labels  # noqa: E731
+    assert len(s.filter(in_labels).cells) == 1
+    labels.add("A2val")
+    assert len(s.filter(in_labels).cells) == 2
+    assert s.filter(in_labels)._expression is None
+
+    # Selections that cannot be described are not memoised
+    picked = s.excel_ref("A1:A3")
+    picked.cells = picked.cells[:2]
+    assert picked._expression is None
+    assert (a - picked)._expression is None
+    assert len((a - picked).cells) == 98
+
+
+def test_memo_opt_out_and_bounds(selectable_simple1: Selectable, counted_check):
+    """
+    Test that memos can be turned off, and that a table's memo holds a
+    bounded number of selections discarding the least recently used.
+    """
+    check, calls = counted_check
+
+    SelectionMemo.enabled = False
+    try:
+        selectable_simple1.excel_ref("A").filter(check)
+        selectable_simple1.excel_ref("A").filter(check)
+        assert len(calls) == 200
+    finally:
+        SelectionMemo.enabled = True
+
+    memo = selectable_simple1.pristine._memo
+    max_size = SelectionMemo.max_size
+    SelectionMemo.max_size = 2
+    try:
+        memo.clear()
+        selectable_simple1.excel_ref("A")
+        selectable_simple1.excel_ref("B")
+        selectable_simple1.excel_ref("A")
+        selectable_simple1.excel_ref("C")
+        assert len(memo) == 2
+        assert [key[-1][-1][0] for key in memo._selections] == [
+            "excel_ref",
+            "excel_ref",
+        ]
+        assert [key[-1][-1][1] for key in memo._selections] == [
+            ("tuple", (("str", "A"),)),
+            ("tuple", (("str", "C"),)),
+        ]
+    finally:
+        SelectionMemo.max_size = max_size
+
+
+def test_memo_goes_with_its_table():
+    """
+    Test that a table's memo does not keep it, or the tables
+    it memoises, in memory once the table is no longer used.
+    """
+    table = acquire([["a", ""], ["", "b"]])
+    source = weakref.ref(table.pristine)
+    assert len(table.excel_ref("A").is_not_blank().cells) == 1
+
+    del table
+    assert source() is None
+
+    # Nor is a table's memo shared with a copy of the table
+    table = acquire([["a"], [""]])
+    spread = table.excel_ref("A1").spread(down)
+    assert spread.pristine is not table.pristine
+    assert len(spread.pristine._memo) == 0
+    assert len(table.pristine._memo) == 1
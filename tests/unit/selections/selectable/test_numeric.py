@@ -0,0 +1,51 @@
+import pytest
+
+from datachef import acquire
+from datachef.selection import filters
+from datachef.selection.selectable import Selectable
+
+
+@pytest.fixture
+def selectable_with_numbers() -> Selectable:
+    return acquire(
+        [
+            #      A         B       C
+            ["Change", "2021", "2022"],  # 1
+            ["North", "-1.5", "2"],  # 2
+            ["South", "3", "x"],  # 3
+            ["Total", "1.5", "  "],  # 4
+        ]
+    )
+
+
+def test_is_numeric_and_is_not_numeric(selectable_with_numbers: Selectable):
+    """
+    Test that we can select the cells that do and do not
+    hold numbers, including decimal and negative numbers.
+    """
+    s = selectable_with_numbers
+    assert len(s.is_numeric().cells) == 6
+    assert len(s.excel_ref("C").is_numeric().cells) == 2
+    assert [c.value for c in s.excel_ref("B1:C4").is_not_numeric().cells] == [
+        "x",
+        "  ",
+    ]
+
+    # The filters agree with the methods, whether called per cell or not
+    assert s.filter(filters.is_numeric).cells == s.is_numeric().cells
+    assert s.filter(filters.is_not_numeric).cells == s.is_not_numeric().cells
+    assert [c for c in s.cells if filters.is_numeric(c)] == s.is_numeric().cells
+    assert [c for c in s.cells if filters.is_not_numeric(c)] == (
+        s.is_not_numeric().cells
+    )
+
+
+def test_numeric_comparisons(selectable_with_numbers: Selectable):
+    """
+    Test that we can select cells by comparing their values as numbers.
+    """
+    s = selectable_with_numbers.excel_ref("B2:C4")
+    assert [c.value for c in s.is_greater_than(1.5).cells] == ["2", "3"]
+    assert [c.value for c in s.is_less_than(1.5).cells] == ["-1.5"]
+    assert [c.value for c in s.is_between(-1.5, 2).cells] == ["-1.5", "2", "1.5"]
+    assert [c.value for c in s.is_integer().cells] == ["2", "3"]
@@ -50,3 +50,21 @@ def test_re_patterns(selectable_simple1: Selectable):
         else:
             with pytest.raises(AssertionError):
                 dfc.assert_quadrilaterals(s.cells)
+
+
+def test_re_reuses_pattern_masks(selectable_simple1: Selectable):
+    """
+    Test that the mask for a pattern is evaluated once per table and
+    reapplied to later selections, and that it is discarded should
+    the values of the table change.
+    """
+
+    s = selectable_simple1.excel_ref("A1:C3").re("^B.*$")
+    assert len(s.cells) == 3
+    mask = selectable_simple1.pristine.pattern_mask("^B.*$")
+    assert selectable_simple1.pristine.pattern_mask("^B.*$") is mask
+    assert len(selectable_simple1.excel_ref("B").re("^B.*$").cells) == 100
+
+    selectable_simple1.pristine.set_value(0, "B-ish")
+    assert selectable_simple1.pristine.pattern_mask("^B.*$") != mask
+    assert len(selectable_simple1.excel_ref("A1:C3").re("^B.*$").cells) == 4
@@ -4,6 +4,7 @@ import pytest
 
 from datachef import acquire
 from datachef.cardinal.directions import down, left, right, up
+from datachef.exceptions import InvalidCellObjectError
 from datachef.selection.selectable import Selectable
 
 
@@ -101,3 +102,100 @@ def test_spread_exceptions():
         bad_direction = copy.deepcopy(up)
         bad_direction.name = "whoops!"
         s.spread(bad_direction)
+
+
+def test_spread_copies_pristine_on_write():
+    """
+    Confirm that selections share the pristine table they were taken
+    from, but that a spread, which writes to the pristine table, takes
+    its own copy rather than modifying the table of other selections.
+    """
+
+    s: Selectable = acquire(
+        [
+            #      A      B      C
+            ["foo", "   ", "   "],  # 1
+            ["   ", "   ", "   "],  # 2
+        ]
+    )
+
+    selection = s.excel_ref("A1")
+    assert selection.pristine is s.pristine
+
+    spread = selection.spread(right)
+    assert spread.pristine is not s.pristine
+    assert spread.excel_ref("C1").lone_value() == "foo"
+
+    # Neither the source or the selection have been changed
+    assert s.excel_ref("C1").lone_value() == "   "
+    assert selection.pcell_at(2, 0).value == "   "
+
+    # Selections from both remain aligned
+    assert len((spread | s.excel_ref("A2")).cells) == 4
+
+
+def test_spread_with_until_from_another_table():
+    """
+    Confirm an "until" selection taken from a different table
+    blocks the spread by position.
+    """
+
+    data = [
+        #      A      B      C
+        ["foo", "   ", "   "],  # 1
+        ["   ", "   ", "   "],  # 2
+        ["   ", "   ", "   "],  # 3
+    ]
+    s: Selectable = acquire(data)
+    other: Selectable = acquire(data)
+
+    spread = s.excel_ref("A1").spread(down, until=other.excel_ref("A3"))
+    assert len(spread.cells) == 2
+    assert spread.excel_ref("A2").lone_value() == "foo"
+    assert spread.pcell_at(0, 2).value == "   "
+
+
+def test_spread_updates_blank_cells():
+    """
+    Confirm that the cells a spread writes to are no longer
+    considered blank by later selections.
+    """
+
+    s: Selectable = acquire(
+        [
+            #      A      B      C
+            ["foo", "   ", "bar"],  # 1
+            ["   ", "   ", "   "],  # 2
+        ]
+    )
+
+    assert len(s.is_blank().cells) == 4
+    spread = s.excel_ref("A1").spread(right)
+    assert len(spread.is_blank().cells) == 0
+    assert [c.value for c in spread.is_not_blank().cells] == ["foo", "foo"]
+
+    # Only the cells of row 2 remain blank
+    blanks = spread.expand(down).is_blank()
+    assert [(c.x, c.y) for c in blanks.cells] == [(0, 1), (1, 1)]
+
+
+def test_spread_with_values_that_are_not_str():
+    """
+    Confirm that a value that is not a str elsewhere in the table
+    does not stop a spread, only one the spread reaches raises.
+    """
+
+    s: Selectable = acquire(
+        [
+            #  A   B
+            [1, ""],  # 1
+            ["a", ""],  # 2
+            ["b", 2],  # 3
+        ]
+    )
+
+    spread = s.excel_ref("A2").spread(right)
+    assert [c.value for c in spread.cells] == ["a", "a"]
+
+    with pytest.raises(InvalidCellObjectError):
+        s.excel_ref("A3").spread(right)
@@ -0,0 +1,41 @@
+import pytest
+
+from datachef import acquire
+from datachef.selection.selectable import Selectable
+
+
+@pytest.fixture
+def selectable_with_totals() -> Selectable:
+    return acquire(
+        [
+            #      A        B        C
+            ["Region", "2021", "2022"],  # 1
+            ["North", "1", "2"],  # 2
+            ["South", "3", "4"],  # 3
+            ["Total", "4", "6"],  # 4
+        ]
+    )
+
+
+def test_is_exactly(selectable_with_totals: Selectable):
+    """
+    Test that we can select the cells holding an exact value,
+    from within the current selection only.
+    """
+    assert selectable_with_totals.is_exactly("Total").lone_value() == "Total"
+    assert len(selectable_with_totals.is_exactly("4").cells) == 2
+    assert len(selectable_with_totals.excel_ref("B").is_exactly("4").cells) == 1
+    assert len(selectable_with_totals.is_exactly("total").cells) == 0
+
+
+def test_is_one_of(selectable_with_totals: Selectable):
+    """
+    Test that we can select the cells holding any one
+    of a set of values.
+    """
+    s = selectable_with_totals.is_one_of({"North", "South", "Elsewhere"})
+    assert [c.value for c in s.cells] == ["North", "South"]
+    assert (
+        len(selectable_with_totals.excel_ref("A1:B4").is_one_of(["4", "1"]).cells) == 2
+    )
+    assert len(selectable_with_totals.is_one_of([]).cells) == 0
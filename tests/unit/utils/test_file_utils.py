@@ -1,3 +1,5 @@
+import csv
+import io
 from pathlib import Path
 
 import pytest
@@ -65,3 +67,60 @@ def test_ensure_existing_path_unexpected_type_raised_err():
     neither_path_nor_str = None
     with pytest.raises(FileInputError):
         fileutils.ensure_existing_path(neither_path_nor_str)
+
+
+def test_csv_row_index():
+    """
+    Test that the rows of a csv are indexed by byte offset and
+    number of fields, newlines within quoted fields not ending
+    a row, however the csv is split into blocks.
+    """
+
+    data = b'a,b\r\n"c\r\nd",""""\n\nlong,"x,y",z'
+    for block_size in [1, 4, 1024]:
+        offsets, widths = fileutils.csv_row_index(data, block_size=block_size)
+        assert list(offsets) == [0, 5, 17, 18, len(data)]
+        assert list(widths) == [2, 2, 0, 3]
+
+    assert fileutils.csv_row_end(data, 5) == 17
+    assert fileutils.decode_csv_row(data[5:17]) == ["c\nd", '"']
+    assert fileutils.decode_csv_row(data[17:18]) == []
+    assert fileutils.decode_csv_row(b"a;b;c\n", delimiter=";") == ["a", "b", "c"]
+    assert fileutils.decode_csv_row(b'"a\rb"\r') == ["a\nb"]
+
+    offsets, widths = fileutils.csv_row_index(b"")
+    assert list(offsets) == [0]
+    assert list(widths) == []
+
+
+def test_csv_row_index_as_read():
+    """
+    Test that the rows indexed are those a csv.reader finds reading the
+    csv in text mode, including where quote characters appear outside
+    of quoted fields and rows end with a lone carriage return.
+    """
+
+    data = b'a"b,"c\nd"\ne,f"\r"g\rh",i\r\n\n"j\r\nk""",5"\n'
+    rows = list(csv.reader(io.TextIOWrapper(io.BytesIO(data), "utf8")))
+
+    for block_size in [1, 4, 8, 1024]:
+        offsets, widths = fileutils.csv_row_index(data, block_size=block_size)
+        assert list(widths) == [len(row) for row in rows]
+        assert [
+            fileutils.decode_csv_row(data[start:end])
+            for start, end in zip(offsets, offsets[1:])
+        ] == rows
+
+
+def test_csv_chunk_offsets():
+    """
+    Test that a csv is split into chunks at the start of rows,
+    never within a quoted field.
+    """
+
+    data = b'a,b\n"c\nd\ne",f\ng,h\n'
+    for block_size in [1, 1024]:
+        assert fileutils.csv_chunk_offsets(data, 1, block_size) == [0, 18]
+        assert fileutils.csv_chunk_offsets(data, 2, block_size) == [0, 14, 18]
+        assert fileutils.csv_chunk_offsets(data, 3, block_size) == [0, 14, 18, 18]
+    assert fileutils.csv_chunk_offsets(b"", 2) == [0, 0, 0]
@@ -0,0 +1,25 @@
+from datachef.utils import maskutils
+
+
+def test_full_mask():
+    """
+    Test we can create a mask with every position of a table set.
+    """
+    assert maskutils.full_mask(0) == 0
+    assert maskutils.full_mask(4) == 0b1111
+
+
+def test_positions_to_and_from_mask():
+    """
+    Test we can convert between a mask and the positions
+    it represents.
+    """
+
+    for positions in [[], [0], [1, 3], [0, 7, 8, 9, 100], list(range(64))]:
+        mask = maskutils.positions_to_mask(positions, 101)
+        assert maskutils.mask_to_positions(mask) == positions
+        assert maskutils.count_positions(mask) == len(positions)
+
+    # Positions are returned in ascending order, whatever the input
+    mask = maskutils.positions_to_mask([9, 2, 5], 10)
+    assert maskutils.mask_to_positions(mask) == [2, 5, 9]
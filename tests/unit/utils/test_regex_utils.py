@@ -0,0 +1,45 @@
+from datachef.utils import regexutils
+
+
+def test_compile_pattern():
+    """
+    Test that patterns are compiled once and then reused.
+    """
+    pattern = regexutils.compile_pattern("^[0-9]{4}$")
+    assert pattern.match("2022")
+    assert not pattern.match("Q1 2022")
+    assert regexutils.compile_pattern("^[0-9]{4}$") is pattern
+
+
+def test_ngrams():
+    """
+    Test that we can break text into its n-grams.
+    """
+    assert regexutils.ngrams("Total") == {"Tot", "ota", "tal"}
+    assert regexutils.ngrams("ab") == set()
+    assert regexutils.ngrams("abc", n=2) == {"ab", "bc"}
+
+
+def test_required_literal():
+    """
+    Test that we can find the literal text required by a pattern,
+    and that we find none where it cannot safely be determined.
+    """
+    for pattern, literal in {
+        "^Total$": "Total",
+        "^[0-9]{4}$": "",
+        "Q[1-4] 2022": " 2022",
+        "abc?d": "ab",
+        "x{2,3}yy": "yy",
+        "abc+": "abc",
+        "a.bcd": "bcd",
+        "(foo)bar": "bar",
+        "foo\\.bar": "foo.bar",
+        "\\d+ apples": " apples",
+        "[]abc]xyz": "xyz",
+        "[^]x]yz": "yz",
+        "[a\\]b]cd": "cd",
+        "a|bcd": "",
+        "(?i)total": "",
+    }.items():
+        assert regexutils.required_literal(pattern) == literal, pattern